@@ -4,17 +4,21 @@ Connects React frontend to Python multi-agent backend
 """
 
 import os
+import re
 import sys
 import uuid
 import asyncio
+import concurrent.futures
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import aiofiles
+import orjson
 import uvicorn
 
 # Add project root to path
@@ -24,18 +28,22 @@ sys.path.insert(0, str(project_root.parent))
 
 # Import backend components
 from src.main import MultiAgentPipeline
-from src.rag_new.rag_system import create_rag_system_from_config, RAGSystem
+from src.rag_new.rag_system import create_rag_system_from_config, load_documents_cached, RAGSystem
 from src.config import RAW_DIR, DATA_DIR
+from src.utils import (
+    cached_pdf_text, file_cache_key, load_file_text, read_cache, write_cache,
+    create_state_store, RedisStateStore
+)
 
 # Jobs directory
 JOBS_DIR = DATA_DIR / "jobs"
-import pdfplumber
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Multi-Agent Candidate Selection API",
     description="API for intelligent candidate evaluation using multi-agent AI system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware for React frontend
@@ -47,11 +55,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Upload chunk size (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Index build batching
+EMBED_BATCH_SIZE = 64
+INSERT_BATCH_SIZE = 2048
+
+# Seconds the latest index build id is kept (reset by every build)
+INDEX_GENERATION_TTL = 30 * 24 * 3600
+
 # Global state
 rag_system: Optional[RAGSystem] = None
 pipeline: Optional[MultiAgentPipeline] = None
-evaluation_states: Dict[str, Dict[str, Any]] = {}
-index_build_progress: Dict[str, Dict[str, Any]] = {}
+# Job state (Redis if REDIS_URL is set, process memory otherwise)
+evaluation_states = create_state_store("evaluation")
+index_build_progress = create_state_store("build")
+index_build_events: Dict[str, asyncio.Event] = {}
+# Build id of the latest completed index build, so every worker can reload the index it
+# holds after a rebuild in another worker (the rebuild deletes the Chroma collection)
+index_generation = create_state_store("index", ttl=INDEX_GENERATION_TTL)
+loaded_index_generation: Optional[str] = None
+
+# Max seconds between two SSE progress messages
+PROGRESS_STREAM_KEEPALIVE = 5.0
+
+# Backend recommendation labels -> frontend format
+_STRONG_RECOMMENDATION_RE = re.compile(r"fortement|strongly", re.IGNORECASE)
+_RECOMMENDATION_RE = re.compile(r"recommand[eé]|recommended", re.IGNORECASE)
 
 # Pydantic models
 class JobOffer(BaseModel):
@@ -84,11 +115,13 @@ class EvaluationStatus(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     """Initialize RAG system and pipeline on startup."""
-    global rag_system, pipeline
+    global rag_system, pipeline, loaded_index_generation
     try:
         print("🚀 Initializing RAG system...")
         rag_system = create_rag_system_from_config()
-        # Try to load existing index
+        # Try to load existing index (the latest build, whichever worker ran it)
+        current = await index_generation.get("current")
+        loaded_index_generation = current["build_id"] if current else None
         if rag_system.load_index():
             print("✅ RAG index loaded successfully")
         else:
@@ -143,13 +176,20 @@ async def upload_cvs(background_tasks: BackgroundTasks, files: List[UploadFile]
             # Save file
             file_path = RAW_DIR / f"{file_id}{file_extension}"
             
-            content = await file.read()
-            file_path.write_bytes(content)
+            # Stream to disk chunk by chunk instead of buffering the whole file
+            size = 0
+            async with aiofiles.open(file_path, "wb") as out_file:
+                while True:
+                    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    await out_file.write(chunk)
+                    size += len(chunk)
             
             uploaded_files.append({
                 "id": file_id,
                 "filename": file.filename,
-                "size": len(content),
+                "size": size,
                 "path": str(file_path),
                 "upload_date": datetime.now().isoformat()
             })
@@ -168,7 +208,7 @@ async def upload_cvs(background_tasks: BackgroundTasks, files: List[UploadFile]
             build_id = str(uuid.uuid4())
             
             # Initialize progress
-            index_build_progress[build_id] = {
+            await init_build_progress(build_id, {
                 "status": "running",
                 "step": "initializing",
                 "progress": 0,
@@ -179,7 +219,7 @@ async def upload_cvs(background_tasks: BackgroundTasks, files: List[UploadFile]
                 "processed_chunks": 0,
                 "message": "Starting index rebuild after CV upload...",
                 "start_time": datetime.now().isoformat()
-            }
+            })
             
             # Start rebuild in background
             background_tasks.add_task(build_index_with_progress, build_id)
@@ -210,7 +250,7 @@ async def build_index(background_tasks: BackgroundTasks):
     build_id = str(uuid.uuid4())
     
     # Initialize progress state
-    index_build_progress[build_id] = {
+    await init_build_progress(build_id, {
         "status": "running",
         "step": "initializing",
         "progress": 0,
@@ -221,7 +261,7 @@ async def build_index(background_tasks: BackgroundTasks):
         "processed_chunks": 0,
         "message": "Starting index build...",
         "start_time": datetime.now().isoformat()
-    }
+    })
     
     # Start building in background
     background_tasks.add_task(build_index_with_progress, build_id)
@@ -234,37 +274,62 @@ async def build_index(background_tasks: BackgroundTasks):
 
 
 async def build_index_with_progress(build_id: str):
-    """Build index with progress updates."""
-    global rag_system, index_build_progress
+    """Build index from all files of the data directory with progress updates."""
+    await _do_build(build_id)
+
+
+async def _do_build(build_id: str,
+                    start_pct: int = 0,
+                    end_pct: int = 100,
+                    owns_file_counters: bool = True):
+    """
+    Build index from all files of the data directory with progress updates.
+    
+    Args:
+        build_id: Progress entry to update
+        start_pct: Overall progress value at which this build starts
+        end_pct: Overall progress value at which this build ends
+        owns_file_counters: Report the file counts of the build (False when the caller
+            already reports its own file progress)
+    """
+    global rag_system, index_build_progress, loaded_index_generation
+    
+    def scale(pct: int) -> int:
+        """Map a build step percentage into the caller's [start_pct, end_pct] range."""
+        return start_pct + (pct * (end_pct - start_pct)) // 100
     
+    progress = None
     try:
-        progress = index_build_progress[build_id]
+        progress = await index_build_progress.get(build_id)
         
         # Step 1: Load documents
         progress["step"] = "loading"
         progress["message"] = "Loading documents..."
-        progress["progress"] = 5
+        progress["progress"] = scale(5)
+        await publish_build_progress(build_id, progress)
         
         if not rag_system.data_dir.exists():
             raise ValueError(f"Data directory not found: {rag_system.data_dir}")
         
-        from llama_index.core import SimpleDirectoryReader
-        documents = SimpleDirectoryReader(
-            input_dir=str(rag_system.data_dir),
-            filename_as_id=True
-        ).load_data()
+        # Only new or modified files are parsed, the rest comes from the document cache.
+        # Parsing is blocking I/O + CPU work: run it off the event loop
+        documents = await asyncio.to_thread(load_documents_cached, rag_system.data_dir)
         
         if not documents:
             raise ValueError(f"No documents found in {rag_system.data_dir}")
         
-        progress["total_files"] = len(documents)
-        progress["message"] = f"Loaded {len(documents)} document(s)"
-        progress["progress"] = 15
+        # PDFs give one document per page
+        file_count = len({doc.metadata["file_path"] for doc in documents})
+        if owns_file_counters:
+            progress["total_files"] = file_count
+        progress["message"] = f"Loaded {len(documents)} document(s) from {file_count} file(s)"
+        progress["progress"] = scale(15)
+        await publish_build_progress(build_id, progress)
         
         # Step 2: Configure metadata
         progress["step"] = "configuring"
         progress["message"] = "Configuring document metadata..."
-        progress["progress"] = 20
+        progress["progress"] = scale(20)
         
         for doc in documents:
             doc.text_template = "Metadata:\n{metadata_str}\n---\nContent:\n{content}"
@@ -272,12 +337,13 @@ async def build_index_with_progress(build_id: str):
                 doc.excluded_embed_metadata_keys.append("page_label")
         
         progress["message"] = f"Configured {len(documents)} document(s)"
-        progress["progress"] = 25
+        progress["progress"] = scale(25)
+        await publish_build_progress(build_id, progress)
         
         # Step 3: Create text splitter
         progress["step"] = "splitting"
         progress["message"] = f"Splitting documents (chunk_size={rag_system.chunk_size})..."
-        progress["progress"] = 30
+        progress["progress"] = scale(30)
         
         from llama_index.core.node_parser import SentenceSplitter
         text_splitter = SentenceSplitter(
@@ -286,16 +352,14 @@ async def build_index_with_progress(build_id: str):
             chunk_overlap=rag_system.chunk_overlap
         )
         
-        # Estimate chunks (rough estimate)
-        total_text_length = sum(len(doc.text) for doc in documents)
-        estimated_chunks = max(1, total_text_length // rag_system.chunk_size)
-        progress["total_chunks"] = estimated_chunks
-        progress["progress"] = 35
+        # total_chunks is set from the real node count once splitting is done
+        progress["progress"] = scale(35)
+        await publish_build_progress(build_id, progress)
         
         # Step 4: Setup ChromaDB
         progress["step"] = "setup_chromadb"
         progress["message"] = "Setting up ChromaDB vector store..."
-        progress["progress"] = 40
+        progress["progress"] = scale(40)
         
         # Delete existing collection to avoid duplicates
         try:
@@ -305,7 +369,8 @@ async def build_index_with_progress(build_id: str):
             pass  # Collection doesn't exist, that's fine
         
         chroma_collection = rag_system.chroma_client.create_collection(
-            name=rag_system.collection_name
+            name=rag_system.collection_name,
+            metadata=rag_system.COLLECTION_METADATA
         )
         from llama_index.vector_stores.chroma import ChromaVectorStore
         from llama_index.core import StorageContext
@@ -313,46 +378,91 @@ async def build_index_with_progress(build_id: str):
         storage_context = StorageContext.from_defaults(vector_store=vector_store)
         
         progress["message"] = f"ChromaDB collection '{rag_system.collection_name}' ready"
-        progress["progress"] = 45
+        progress["progress"] = scale(45)
+        await publish_build_progress(build_id, progress)
         
-        # Step 5: Create index with embeddings (this is the slow part)
+        # Step 5: Split, embed in batches and build the index (this is the slow part)
         progress["step"] = "embedding"
         progress["message"] = "Creating embeddings and building vector index..."
-        progress["progress"] = 50
-        
-        # Create a custom callback to track embedding progress
-        class ProgressCallback:
-            def __init__(self, progress_dict, total_docs):
-                self.progress_dict = progress_dict
-                self.total_docs = total_docs
-                self.processed = 0
-            
-            def __call__(self, *args, **kwargs):
-                self.processed += 1
-                # Estimate progress: 50% start + 40% for embeddings
-                embedding_progress = 50 + int((self.processed / self.total_docs) * 40)
-                self.progress_dict["progress"] = min(90, embedding_progress)
-                self.progress_dict["processed_files"] = self.processed
-                self.progress_dict["message"] = f"Processing embeddings: {self.processed}/{self.total_docs} documents"
+        progress["progress"] = scale(50)
         
         from llama_index.core import VectorStoreIndex
-        rag_system.index = VectorStoreIndex.from_documents(
-            documents=documents,
+        from llama_index.core.schema import MetadataMode
+        nodes = await asyncio.to_thread(text_splitter.get_nodes_from_documents, documents)
+        progress["total_chunks"] = len(nodes)
+        await publish_build_progress(build_id, progress)
+        
+        # Reuse embeddings of unchanged files (keyed by file hash + model + chunking)
+        embed_settings = f"{rag_system.embedding_model_name}:{rag_system.chunk_size}:{rag_system.chunk_overlap}"
+        if rag_system.quantize_embeddings:
+            embed_settings += ":int8"
+        nodes_by_file: Dict[str, List[Any]] = {}
+        for node in nodes:
+            nodes_by_file.setdefault(node.metadata.get("file_path", ""), []).append(node)
+        
+        pending_nodes = []
+        pending_keys: Dict[str, str] = {}
+        for file_path, file_nodes in nodes_by_file.items():
+            key = file_cache_key(file_path, extra=embed_settings) if file_path and Path(file_path).exists() else None
+            cached = read_cache("embeddings", key) if key else None
+            if cached is not None and len(cached) == len(file_nodes):
+                for node, embedding in zip(file_nodes, cached):
+                    node.embedding = embedding
+            else:
+                pending_nodes.extend(file_nodes)
+                if key:
+                    pending_keys[file_path] = key
+        
+        cached_count = len(nodes) - len(pending_nodes)
+        progress["processed_chunks"] = cached_count
+        await publish_build_progress(build_id, progress)
+        
+        # Embed remaining chunks batch by batch instead of one model call per chunk
+        embed_model = rag_system.embed_model
+        embed_model.embed_batch_size = EMBED_BATCH_SIZE
+        for start in range(0, len(pending_nodes), EMBED_BATCH_SIZE):
+            batch = pending_nodes[start:start + EMBED_BATCH_SIZE]
+            embeddings = await asyncio.to_thread(
+                embed_model.get_text_embedding_batch,
+                [node.get_content(metadata_mode=MetadataMode.EMBED) for node in batch]
+            )
+            for node, embedding in zip(batch, embeddings):
+                node.embedding = embedding
+            
+            processed = cached_count + start + len(batch)
+            progress["processed_chunks"] = processed
+            # 50% start + 35% for embeddings
+            progress["progress"] = scale(50 + int((processed / len(nodes)) * 35))
+            progress["message"] = f"Processing embeddings: {processed}/{len(nodes)} chunks"
+            await publish_build_progress(build_id, progress)
+        
+        for file_path, key in pending_keys.items():
+            write_cache("embeddings", key, [node.embedding for node in nodes_by_file[file_path]])
+        
+        # Nodes already carry their embeddings, the index only has to insert them
+        progress["message"] = "Building vector index..."
+        await publish_build_progress(build_id, progress)
+        rag_system.index = await asyncio.to_thread(
+            VectorStoreIndex,
+            nodes=nodes,
             storage_context=storage_context,
-            embed_model=rag_system.embed_model,
-            transformations=[text_splitter],
+            embed_model=embed_model,
+            insert_batch_size=INSERT_BATCH_SIZE,
             show_progress=True
         )
         
         progress["step"] = "finalizing"
         progress["message"] = "Finalizing index..."
-        progress["progress"] = 90
-        progress["processed_files"] = len(documents)
+        progress["progress"] = scale(90)
+        if owns_file_counters:
+            progress["processed_files"] = file_count
+        await publish_build_progress(build_id, progress)
         
         # Step 6: Create query engine
         if rag_system.llm:
             progress["message"] = "Creating query engine..."
-            progress["progress"] = 95
+            progress["progress"] = scale(95)
+            await publish_build_progress(build_id, progress)
             
             from llama_index.core.prompts import PromptTemplate
             qa_prompt_template = PromptTemplate(
@@ -382,27 +492,111 @@ async def build_index_with_progress(build_id: str):
                     response_mode="compact"
                 )
         
+        # Tell the other workers to reload the index before their next query
+        await index_generation.set("current", {"build_id": build_id, "end_time": datetime.now().isoformat()})
+        loaded_index_generation = build_id
+        
         progress["status"] = "completed"
         progress["step"] = "completed"
-        progress["message"] = f"Index built successfully! Processed {len(documents)} documents."
-        progress["progress"] = 100
+        progress["message"] = f"Index built successfully! Processed {file_count} files."
+        progress["progress"] = scale(100)
         progress["end_time"] = datetime.now().isoformat()
+        await publish_build_progress(build_id, progress)
         
     except Exception as e:
         import traceback
         traceback.print_exc()
-        progress["status"] = "error"
-        progress["message"] = f"Error: {str(e)}"
-        progress["error"] = str(e)
+        await publish_build_error(build_id, progress, e)
+
+
+async def publish_build_error(build_id: str, progress: Optional[Dict[str, Any]], error: Exception):
+    """
+    Mark a build as failed.
+    
+    progress is None when the failure happened before the state was read, or when
+    the state had expired: it is then re-read, or started over if it is gone.
+    """
+    if progress is None:
+        try:
+            progress = await index_build_progress.get(build_id)
+        except Exception as e:
+            print(f"⚠️  Could not read build state {build_id}: {e}")
+        progress = progress or {}
+    
+    progress["status"] = "error"
+    progress["message"] = f"Error: {str(error)}"
+    progress["error"] = str(error)
+    await publish_build_progress(build_id, progress)
+
+
+async def ensure_current_index():
+    """Reload the RAG index if it was rebuilt by another worker since this one loaded it."""
+    global loaded_index_generation
+    if rag_system is None:
+        return
+    
+    current = await index_generation.get("current")
+    if current and current["build_id"] != loaded_index_generation:
+        print("🔄 RAG index rebuilt by another worker, reloading...")
+        await asyncio.to_thread(rag_system.load_index)
+        loaded_index_generation = current["build_id"]
+
+
+async def init_build_progress(build_id: str, progress: Dict[str, Any]):
+    """Store the initial state of a build started by this worker and register its stream event."""
+    index_build_events[build_id] = asyncio.Event()
+    await index_build_progress.set(build_id, progress)
+
+
+async def publish_build_progress(build_id: str, progress: Dict[str, Any]):
+    """Persist a progress update and wake up progress stream listeners."""
+    await index_build_progress.set(build_id, progress)
+    event = index_build_events.get(build_id)
+    if event:
+        event.set()
+        event.clear()
+    if progress.get("status") in ("completed", "error"):
+        index_build_events.pop(build_id, None)
 
 
 @app.get("/api/index-build-progress/{build_id}")
 async def get_index_build_progress(build_id: str):
-    """Get index build progress."""
-    if build_id not in index_build_progress:
-        raise HTTPException(status_code=404, detail="Build not found")
+    """
+    Get index build progress.
+    
+    Build states expire one hour after their last update.
+    """
+    progress = await index_build_progress.get(build_id)
+    if progress is None:
+        raise HTTPException(status_code=404, detail="Build not found or expired")
+    
+    return progress
+
+
+@app.get("/api/index-build-progress/{build_id}/stream")
+async def stream_index_build_progress(build_id: str):
+    """Stream index build progress as Server-Sent Events until the build ends."""
+    if await index_build_progress.get(build_id) is None:
+        raise HTTPException(status_code=404, detail="Build not found or expired")
+    
+    # Finished builds and builds running in another worker have no event here:
+    # wait on a local one that is never set, the keep-alive re-reads their state
+    event = index_build_events.get(build_id) or asyncio.Event()
+    
+    async def event_gen():
+        while True:
+            progress = await index_build_progress.get(build_id)
+            if progress is None:
+                break
+            yield f"data: {orjson.dumps(progress).decode()}\n\n"
+            if progress["status"] in ("completed", "error"):
+                break
+            try:
+                await asyncio.wait_for(event.wait(), timeout=PROGRESS_STREAM_KEEPALIVE)
+            except asyncio.TimeoutError:
+                pass
     
-    return index_build_progress[build_id]
+    return StreamingResponse(event_gen(), media_type="text/event-stream")
 
 
 @app.post("/api/start-evaluation")
@@ -427,20 +621,21 @@ async def start_evaluation(request: EvaluationRequest, background_tasks: Backgro
     evaluation_id = str(uuid.uuid4())
     
     # Initialize evaluation state
-    evaluation_states[evaluation_id] = {
+    await evaluation_states.set(evaluation_id, {
         "status": "running",
-        "agents": [
-            {"id": "rh-agent", "name": "RH Agent", "status": "waiting", "progress": 0},
-            {"id": "profile-agent", "name": "Profile Agent", "status": "waiting", "progress": 0},
-            {"id": "technical-agent", "name": "Technical Agent", "status": "waiting", "progress": 0},
-            {"id": "softskills-agent", "name": "Soft Skills Agent", "status": "waiting", "progress": 0},
-            {"id": "decision-agent", "name": "Decision Agent", "status": "waiting", "progress": 0},
-        ],
+        # Keyed by agent id for O(1) status updates
+        "agents": {
+            "rh-agent": {"name": "RH Agent", "status": "waiting", "progress": 0},
+            "profile-agent": {"name": "Profile Agent", "status": "waiting", "progress": 0},
+            "technical-agent": {"name": "Technical Agent", "status": "waiting", "progress": 0},
+            "softskills-agent": {"name": "Soft Skills Agent", "status": "waiting", "progress": 0},
+            "decision-agent": {"name": "Decision Agent", "status": "waiting", "progress": 0},
+        },
         "candidates": [],
         "decision": None,
         "job_offer": request.job_offer.dict(),
         "start_time": datetime.now().isoformat()
-    }
+    })
     
     # Start evaluation in background
     background_tasks.add_task(
@@ -469,11 +664,27 @@ async def run_evaluation(
     """Run evaluation in background and update state."""
     global pipeline, evaluation_states
     
+    # Progress writes scheduled from the pipeline thread, applied in order by one writer
+    progress_writes: List[concurrent.futures.Future] = []
+    write_lock = asyncio.Lock()
+    
+    async def write_state():
+        async with write_lock:
+            await evaluation_states.set(evaluation_id, state)
+    
+    async def flush_progress_writes():
+        """Wait for pending progress writes, so none lands after the final state."""
+        for future in progress_writes:
+            try:
+                await asyncio.wrap_future(future)
+            except Exception as e:
+                print(f"⚠️  Could not store evaluation progress: {e}")
+        progress_writes.clear()
+    
     try:
-        state = evaluation_states[evaluation_id]
+        state = await evaluation_states.get(evaluation_id)
+        await ensure_current_index()
         
-        # Step 1: RH Agent
-        update_agent_status(evaluation_id, "rh-agent", "processing", 0)
         job_description = f"{job_offer.title}\n\n{job_offer.description}\n\nRequirements:\n{job_offer.requirements}"
         if job_offer.location:
             job_description += f"\nLocation: {job_offer.location}"
@@ -487,74 +698,52 @@ async def run_evaluation(
         if job_offer.salary:
             criteres["salaire"] = job_offer.salary
         
-        # Simulate progress for RH Agent
-        for progress in [25, 50, 75, 100]:
-            await asyncio.sleep(0.5)
-            update_agent_status(evaluation_id, "rh-agent", "processing", progress)
+        # Agent progress is reported by the pipeline (from its worker thread) as each real step runs
+        loop = asyncio.get_running_loop()
+        
+        def report_progress(agent_id: str, progress: int):
+            status = "completed" if progress >= 100 else "processing"
+            update_agent_status(state, agent_id, status, progress)
+            progress_writes.append(asyncio.run_coroutine_threadsafe(write_state(), loop))
         
         # Process job offer - USE cv_ids if provided!
-        results = pipeline.process_job_offer(
+        # Run the synchronous pipeline in a worker thread so polling stays responsive
+        results = await asyncio.to_thread(
+            pipeline.process_job_offer,
             job_description=job_description,
             criteres=criteres if criteres else None,
             use_rag=use_rag and rag_system and rag_system.index is not None,
             max_candidates=max_candidates,
-            cv_ids=cv_ids if cv_ids else None  # Pass cv_ids to pipeline!
+            cv_ids=cv_ids if cv_ids else None,  # Pass cv_ids to pipeline!
+            progress_cb=report_progress
         )
+        await flush_progress_writes()
         
-        update_agent_status(evaluation_id, "rh-agent", "completed", 100)
+        # Steps skipped by the pipeline (e.g. no candidates found) are done too
+        for agent_id in state["agents"]:
+            update_agent_status(state, agent_id, "completed", 100)
         
-        # Step 2: Profile Agent (processes all candidates)
-        update_agent_status(evaluation_id, "profile-agent", "processing", 0)
         candidates = results.get("candidates_evaluated", [])
         
-        # Simulate progress
-        for i, candidate in enumerate(candidates):
-            progress = int((i + 1) / len(candidates) * 100) if candidates else 100
-            update_agent_status(evaluation_id, "profile-agent", "processing", progress)
-            await asyncio.sleep(0.3)
-        
-        update_agent_status(evaluation_id, "profile-agent", "completed", 100)
-        
-        # Step 3: Technical Agent
-        update_agent_status(evaluation_id, "technical-agent", "processing", 0)
-        for progress in [25, 50, 75, 100]:
-            await asyncio.sleep(0.3)
-            update_agent_status(evaluation_id, "technical-agent", "processing", progress)
-        update_agent_status(evaluation_id, "technical-agent", "completed", 100)
-        
-        # Step 4: Soft Skills Agent
-        update_agent_status(evaluation_id, "softskills-agent", "processing", 0)
-        for progress in [25, 50, 75, 100]:
-            await asyncio.sleep(0.3)
-            update_agent_status(evaluation_id, "softskills-agent", "processing", progress)
-        update_agent_status(evaluation_id, "softskills-agent", "completed", 100)
-        
-        # Step 5: Decision Agent
-        update_agent_status(evaluation_id, "decision-agent", "processing", 0)
-        for progress in [25, 50, 75, 100]:
-            await asyncio.sleep(0.3)
-            update_agent_status(evaluation_id, "decision-agent", "processing", progress)
-        update_agent_status(evaluation_id, "decision-agent", "completed", 100)
-        
-        # Convert candidates to frontend format
+        # Convert candidates to frontend format (each score is read and rounded once)
         formatted_candidates = []
         for candidate in candidates:
+            scores = {
+                "profile": round(candidate.get("score_profil", 0), 1),
+                "technical": round(candidate.get("score_technique", 0), 1),
+                "softSkills": round(candidate.get("score_softskills", 0), 1),
+                "global": round(candidate.get("score_global", 0), 1)
+            }
             formatted_candidates.append({
-                "id": candidate.get("candidate_id", str(uuid.uuid4())),
+                "id": candidate.get("candidate_id") or uuid.uuid4().hex,
                 "name": candidate.get("nom", "Unknown"),
-                "scores": {
-                    "profile": round(candidate.get("score_profil", 0), 1),
-                    "technical": round(candidate.get("score_technique", 0), 1),
-                    "softSkills": round(candidate.get("score_softskills", 0), 1),
-                    "global": round(candidate.get("score_global", 0), 1)
-                },
+                "scores": scores,
                 "recommendation": map_recommendation(candidate.get("recommandation", "")),
                 "justification": candidate.get("justification", ""),
-                "aiJustification": candidate.get("justification", ""),
                 "radarData": {
-                    "profile": round(candidate.get("score_profil", 0), 1),
-                    "technical": round(candidate.get("score_technique", 0), 1),
-                    "softSkills": round(candidate.get("score_softskills", 0), 1),
+                    "profile": scores["profile"],
+                    "technical": scores["technical"],
+                    "softSkills": scores["softSkills"],
                     "experience": 80,  # Default, can be extracted from profil_data
                     "education": 85,   # Default
                     "certifications": 75  # Default
@@ -579,32 +768,28 @@ async def run_evaluation(
         state["candidates"] = formatted_candidates
         state["decision"] = decision_output
         state["end_time"] = datetime.now().isoformat()
+        await evaluation_states.set(evaluation_id, state)
         
     except Exception as e:
         print(f"❌ Evaluation error: {e}")
         import traceback
         traceback.print_exc()
+        await flush_progress_writes()
         state["status"] = "error"
         state["error"] = str(e)
+        await evaluation_states.set(evaluation_id, state)
 
 
-def update_agent_status(evaluation_id: str, agent_id: str, status: str, progress: int):
+def update_agent_status(state: Dict[str, Any], agent_id: str, status: str, progress: int):
     """Update agent status in evaluation state."""
-    if evaluation_id in evaluation_states:
-        agents = evaluation_states[evaluation_id]["agents"]
-        for agent in agents:
-            if agent["id"] == agent_id:
-                agent["status"] = status
-                agent["progress"] = progress
-                break
+    state["agents"][agent_id].update(status=status, progress=progress)
 
 
 def map_recommendation(rec: str) -> str:
     """Map backend recommendation to frontend format."""
-    rec_lower = rec.lower()
-    if "fortement" in rec_lower or "strongly" in rec_lower:
+    if _STRONG_RECOMMENDATION_RE.search(rec):
         return "strongly-recommended"
-    elif "recommandé" in rec_lower or "recommended" in rec_lower:
+    elif _RECOMMENDATION_RE.search(rec):
         return "recommended"
     else:
         return "not-recommended"
@@ -612,62 +797,71 @@ def map_recommendation(rec: str) -> str:
 
 @app.get("/api/evaluation/{evaluation_id}")
 async def get_evaluation_status(evaluation_id: str):
-    """Get evaluation status and results."""
-    if evaluation_id not in evaluation_states:
-        raise HTTPException(status_code=404, detail="Evaluation not found")
+    """
+    Get evaluation status and results.
+    
+    Evaluation states expire one hour after their last update.
+    """
+    state = await evaluation_states.get(evaluation_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Evaluation not found or expired")
     
-    state = evaluation_states[evaluation_id]
+    # The justification is stored once and exposed under both frontend keys
+    decision = state["decision"]
+    if decision:
+        decision = {**decision, "topCandidate": with_ai_justification(decision["topCandidate"])}
     
     return {
         "status": state["status"],
-        "agents": state["agents"],
-        "candidates": state["candidates"],
-        "decision": state["decision"],
+        "agents": [{"id": agent_id, **agent} for agent_id, agent in state["agents"].items()],
+        "candidates": [with_ai_justification(candidate) for candidate in state["candidates"]],
+        "decision": decision,
         "error": state.get("error")
     }
 
 
-@app.get("/api/files/resumes")
-async def list_resume_files():
-    """List all available resume files in DATA/raw."""
+def with_ai_justification(candidate: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the aiJustification field expected by the frontend."""
+    return {**candidate, "aiJustification": candidate.get("justification", "")}
+
+
+def _list_data_files(directory: Path) -> List[Dict[str, Any]]:
+    """List .txt/.pdf files of a data directory in a single scandir pass."""
     files = []
     
-    if RAW_DIR.exists():
-        candidate_files = list(RAW_DIR.glob("*.txt")) + list(RAW_DIR.glob("*.pdf"))
-        for file_path in candidate_files:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            stem, _, ext = entry.name.rpartition(".")
+            ext = ext.lower()
+            if not stem or ext not in ("txt", "pdf"):
+                continue
             try:
+                if not entry.is_file():
+                    continue
                 files.append({
-                    "id": file_path.stem,
-                    "filename": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "type": file_path.suffix.replace(".", ""),
-                    "path": str(file_path.relative_to(DATA_DIR.parent))
+                    "id": stem,
+                    "filename": entry.name,
+                    "size": entry.stat().st_size,
+                    "type": ext,
+                    "path": os.path.relpath(entry.path, DATA_DIR.parent)
                 })
-            except Exception as e:
-                print(f"Error reading file {file_path}: {e}")
+            except OSError as e:
+                print(f"Error reading file {entry.path}: {e}")
     
+    return files
+
+
+@app.get("/api/files/resumes")
+async def list_resume_files():
+    """List all available resume files in DATA/raw."""
+    files = _list_data_files(RAW_DIR) if RAW_DIR.exists() else []
     return {"files": files}
 
 
 @app.get("/api/files/job-offers")
 async def list_job_offer_files():
     """List all available job offer files in DATA/jobs."""
-    files = []
-    
-    if JOBS_DIR.exists():
-        job_files = list(JOBS_DIR.glob("*.txt")) + list(JOBS_DIR.glob("*.pdf"))
-        for file_path in job_files:
-            try:
-                files.append({
-                    "id": file_path.stem,
-                    "filename": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "type": file_path.suffix.replace(".", ""),
-                    "path": str(file_path.relative_to(DATA_DIR.parent))
-                })
-            except Exception as e:
-                print(f"Error reading file {file_path}: {e}")
-    
+    files = _list_data_files(JOBS_DIR) if JOBS_DIR.exists() else []
     return {"files": files}
 
 
@@ -684,14 +878,7 @@ async def get_job_offer_file(file_id: str):
         if file_path.stem == file_id or file_path.name == file_id:
             try:
                 if file_path.suffix.lower() == ".pdf":
-                    import pdfplumber
-                    text_parts = []
-                    with pdfplumber.open(file_path) as pdf:
-                        for page in pdf.pages:
-                            page_text = page.extract_text()
-                            if page_text:
-                                text_parts.append(page_text)
-                    content = "\n\n".join(text_parts)
+                    content = cached_pdf_text(file_path)
                 else:
                     content = file_path.read_text(encoding='utf-8', errors='ignore')
                 
@@ -733,7 +920,7 @@ async def process_selected_resumes(
     build_id = str(uuid.uuid4())
     
     # Initialize progress state
-    index_build_progress[build_id] = {
+    await init_build_progress(build_id, {
         "status": "running",
         "step": "initializing",
         "progress": 0,
@@ -745,7 +932,7 @@ async def process_selected_resumes(
         "message": "Starting resume processing...",
         "start_time": datetime.now().isoformat(),
         "selected_files": request.file_ids or []
-    }
+    })
     
     # Start processing in background
     background_tasks.add_task(process_resumes_with_progress, build_id, request.file_ids)
@@ -761,8 +948,9 @@ async def process_resumes_with_progress(build_id: str, file_ids: Optional[List[s
     """Process selected resumes and rebuild index with progress updates."""
     global rag_system, index_build_progress
     
+    progress = None
     try:
-        progress = index_build_progress[build_id]
+        progress = await index_build_progress.get(build_id)
         
         # Count files to process
         if RAW_DIR.exists():
@@ -775,36 +963,72 @@ async def process_resumes_with_progress(build_id: str, file_ids: Optional[List[s
             progress["total_files"] = len(files_to_process)
             progress["message"] = f"Processing {len(files_to_process)} resume file(s)..."
             progress["progress"] = 10
+            await publish_build_progress(build_id, progress)
             
-            # Process each file
-            for i, file_path in enumerate(files_to_process):
+            # Extract the text of the selected files into the PDF text cache, in worker
+            # threads (the default executor is bounded, and nothing forks this process,
+            # which holds the embedding model)
+            async def extract(file_path: Path):
+                await asyncio.to_thread(load_file_text, file_path)
+                return file_path
+            
+            tasks = [extract(file_path) for file_path in files_to_process]
+            for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                try:
+                    file_path = await task
+                except Exception as e:
+                    print(f"⚠️  Failed to extract text: {e}")
+                    continue
+                
                 progress["current_file"] = file_path.name
                 progress["processed_files"] = i
                 progress["progress"] = 10 + int((i / len(files_to_process)) * 20)
-                progress["message"] = f"Processing {file_path.name} ({i+1}/{len(files_to_process)})..."
-                await asyncio.sleep(0.1)  # Small delay for UI update
+                progress["message"] = f"Processed {file_path.name} ({i}/{len(files_to_process)})"
+                await publish_build_progress(build_id, progress)
             
+            progress["current_file"] = None
             progress["progress"] = 30
             progress["message"] = "Rebuilding index with processed resumes..."
+            await publish_build_progress(build_id, progress)
         else:
             raise ValueError("DATA/raw directory not found")
         
-        # Now rebuild index
-        await build_index_with_progress(build_id)
+        # Now rebuild the index from the whole data directory (the collection is recreated,
+        # so unselected resumes must stay in it); selected files come from the text cache.
+        # Mapped onto the remaining 30-100% of the progress bar
+        await _do_build(build_id, start_pct=30, end_pct=100, owns_file_counters=False)
         
     except Exception as e:
         import traceback
         traceback.print_exc()
-        progress["status"] = "error"
-        progress["message"] = f"Error: {str(e)}"
-        progress["error"] = str(e)
+        await publish_build_error(build_id, progress, e)
 
 
 if __name__ == "__main__":
+    # DEV=1 enables auto-reload (single worker)
+    dev_mode = os.getenv("DEV") == "1"
+    
+    # Job state and the index build id are only shared between workers through Redis:
+    # check the store that was actually created (REDIS_URL may be set without redis installed)
+    shared_state = isinstance(evaluation_states, RedisStateStore)
+    if dev_mode:
+        workers = 1
+    elif not shared_state:
+        if int(os.getenv("API_WORKERS", "1")) > 1:
+            print("⚠️  API_WORKERS > 1 needs a Redis state store (REDIS_URL + redis package), using 1 worker")
+        workers = 1
+    elif os.getenv("API_WORKERS"):
+        workers = int(os.getenv("API_WORKERS"))
+    else:
+        workers = max(2, (os.cpu_count() or 2) // 2)
+    
     uvicorn.run(
         "backend_api:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=dev_mode,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop is not available on Windows
+        http="httptools"
     )
 
@@ -3,15 +3,51 @@ Script to clean ChromaDB vector store
 Removes all collections and resets the database
 """
 
+import sqlite3
 import chromadb
 from pathlib import Path
 
-def clean_chromadb(vectorstore_dir: str = "./DATA/vectorstore"):
+
+def compact_chromadb_sqlite(vectorstore_path: Path):
+    """
+    Reclaim disk space left behind by deleted collections.
+    
+    delete_collection only soft-deletes rows: the write-ahead log and the
+    embeddings_queue table keep the data until the sqlite file is vacuumed.
+    
+    Args:
+        vectorstore_path: Path to ChromaDB storage directory
+    """
+    db_path = vectorstore_path / "chroma.sqlite3"
+    if not db_path.exists():
+        return
+    
+    size_before = db_path.stat().st_size
+    conn = sqlite3.connect(str(db_path))
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        try:
+            conn.execute("DELETE FROM embeddings_queue")
+            conn.commit()
+        except sqlite3.OperationalError:
+            pass  # Older ChromaDB versions have no embeddings queue
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    
+    size_after = db_path.stat().st_size
+    print(f"🗜️  Compacted {db_path.name}: {size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB")
+
+
+def clean_chromadb(vectorstore_dir: str = "./DATA/vectorstore", verbose: bool = True):
     """
     Clean ChromaDB by deleting all collections.
     
     Args:
         vectorstore_dir: Path to ChromaDB storage directory
+        verbose: Print the document count of each collection before deleting it.
+                 Counting scans the collection's segment metadata, which is slow
+                 on large stores; pass False to only print collection names.
     """
     vectorstore_path = Path(vectorstore_dir)
     
@@ -31,8 +67,11 @@ def clean_chromadb(vectorstore_dir: str = "./DATA/vectorstore"):
         
         for collection in collections:
             collection_name = collection.name
-            count = collection.count()
-            print(f"   - {collection_name}: {count} documents")
+            if verbose:
+                count = collection.count()
+                print(f"   - {collection_name}: {count} documents")
+            else:
+                print(f"   - {collection_name}")
             
             # Delete collection
             try:
@@ -41,6 +80,11 @@ def clean_chromadb(vectorstore_dir: str = "./DATA/vectorstore"):
             except Exception as e:
                 print(f"   ❌ Error deleting collection '{collection_name}': {e}")
         
+        # Release the client's sqlite connections before vacuuming
+        client.clear_system_cache()
+        del client
+        compact_chromadb_sqlite(vectorstore_path)
+        
         print(f"\n✅ ChromaDB cleaned successfully!")
         print(f"💡 You can now rebuild the index to start fresh.")
         
@@ -50,9 +94,11 @@ def clean_chromadb(vectorstore_dir: str = "./DATA/vectorstore"):
 if __name__ == "__main__":
     import sys
     
-    # Allow custom path
-    if len(sys.argv) > 1:
-        vectorstore_dir = sys.argv[1]
+    # Allow custom path, and --quiet to skip per-collection document counts
+    args = [arg for arg in sys.argv[1:] if arg != "--quiet"]
+    verbose = "--quiet" not in sys.argv[1:]
+    if args:
+        vectorstore_dir = args[0]
     else:
         vectorstore_dir = "./DATA/vectorstore"
     
@@ -64,7 +110,7 @@ if __name__ == "__main__":
     response = input("⚠️  This will delete ALL collections in ChromaDB. Continue? (yes/no): ")
     
     if response.lower() in ['yes', 'y', 'oui', 'o']:
-        clean_chromadb(vectorstore_dir)
+        clean_chromadb(vectorstore_dir, verbose=verbose)
     else:
         print("❌ Operation cancelled.")
 
@@ -35,7 +35,27 @@ export default function IndexBuildProgress({ buildId, onComplete }: IndexBuildPr
     }
 
     setIsPolling(true);
-    let pollInterval: NodeJS.Timeout;
+    let pollInterval: NodeJS.Timeout | undefined;
+    let finished = false;
+
+    const handleProgress = (data: ProgressData) => {
+      if (finished) {
+        return;
+      }
+      setProgress(data);
+
+      if (data.status === 'completed' || data.status === 'error') {
+        finished = true;
+        eventSource.close();
+        if (pollInterval) {
+          clearInterval(pollInterval);
+        }
+        setIsPolling(false);
+        if (data.status === 'completed' && onComplete) {
+          setTimeout(onComplete, 2000);
+        }
+      }
+    };
 
     const pollProgress = async () => {
       try {
@@ -43,26 +63,32 @@ export default function IndexBuildProgress({ buildId, onComplete }: IndexBuildPr
         if (!response.ok) {
           throw new Error('Failed to fetch progress');
         }
-        const data = await response.json();
-        setProgress(data);
-
-        if (data.status === 'completed' || data.status === 'error') {
-          setIsPolling(false);
-          if (data.status === 'completed' && onComplete) {
-            setTimeout(onComplete, 2000);
-          }
-        }
+        handleProgress(await response.json());
       } catch (error) {
+        // Keep polling: the backend may be restarting
         console.error('Error polling progress:', error);
-        setIsPolling(false);
       }
     };
 
-    // Poll immediately, then every second
-    pollProgress();
-    pollInterval = setInterval(pollProgress, 1000);
+    // Progress is pushed by the backend as Server-Sent Events
+    const eventSource = new EventSource(`${API_BASE_URL}/api/index-build-progress/${buildId}/stream`);
+
+    eventSource.onmessage = (event) => {
+      handleProgress(JSON.parse(event.data));
+    };
+
+    eventSource.onerror = (error) => {
+      // Stream dropped (proxy timeout, backend restart...): fall back to polling every second
+      console.error('Error streaming progress, polling instead:', error);
+      eventSource.close();
+      if (!finished && !pollInterval) {
+        pollProgress();
+        pollInterval = setInterval(pollProgress, 1000);
+      }
+    };
 
     return () => {
+      eventSource.close();
       if (pollInterval) {
         clearInterval(pollInterval);
       }
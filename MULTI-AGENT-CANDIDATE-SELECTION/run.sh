@@ -1,4 +1,4 @@
 #!/bin/bash
 echo "Starting Multi-Agent Candidate Selection System..."
-streamlit run src/app/app.py
+exec streamlit run src/app/app.py
 
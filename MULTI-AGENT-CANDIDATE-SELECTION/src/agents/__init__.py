@@ -1,10 +1,16 @@
 """Multi-Agent System for Candidate Selection"""
 
-from .agent_rh import AgentRH
-from .agent_profil import AgentProfil
-from .agent_technique import AgentTechnique
-from .agent_softskills import AgentSoftSkills
-from .agent_decideur import AgentDecideur
+import importlib
+
+# Agent classes are imported on first access (PEP 562), so using one agent
+# does not load the others and their dependencies (e.g. numpy).
+_AGENT_MODULES = {
+    'AgentRH': '.agent_rh',
+    'AgentProfil': '.agent_profil',
+    'AgentTechnique': '.agent_technique',
+    'AgentSoftSkills': '.agent_softskills',
+    'AgentDecideur': '.agent_decideur'
+}
 
 __all__ = [
     'AgentRH',
@@ -13,3 +19,16 @@ __all__ = [
     'AgentSoftSkills',
     'AgentDecideur'
 ]
+
+
+def __getattr__(name):
+    if name not in _AGENT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    agent_class = getattr(importlib.import_module(_AGENT_MODULES[name], __name__), name)
+    globals()[name] = agent_class
+    return agent_class
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,29 @@
+"""
+Numeric kernels for Agent Décideur
+Exact vectorized rounding of global scores
+"""
+
+import numpy as np
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """
+    Round an array to 2 decimals exactly like Python's round(x, 2), element-wise.
+    
+    np.round(x, 2) rounds fl(x * 100), which loses the half-way information
+    (53.945 is stored slightly above the half but fl(53.945 * 100) is below it).
+    Here the product is split into fl(x * 100) + error (Dekker) and the error
+    decides the rounding direction, with ties to even (and the sign of zero
+    is kept, as round(-0.001, 2) gives -0.0).
+    """
+    p = values * 100.0
+    c = 134217729.0 * values
+    hi = c - (c - values)
+    lo = values - hi
+    err = ((hi * 100.0 - p) + lo * 100.0)
+    
+    k = np.floor(p)
+    diff = (p - k) - 0.5
+    round_up = (diff > -err) | ((diff == -err) & (k % 2.0 != 0.0))
+    return np.copysign((k + round_up) / 100.0, values)
+
@@ -3,7 +3,38 @@ Agent Décideur - Aggregates agent opinions and generates final ranking
 Justifies decisions and produces comprehensive reports
 """
 
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from ._decideur_kernels import round2
+
+# Scoring weights (profil, technique, soft skills)
+_WEIGHTS = (0.3, 0.4, 0.3)
+
+
+class _Stats(NamedTuple):
+    """Report statistics; field names are the keys of the report's "statistiques" dict."""
+    total_candidats: int
+    score_moyen: float
+    score_max: float
+    score_min: float
+    score_technique_moyen: float
+    score_softskills_moyen: float
+
+
+class RankedCandidates(list):
+    """
+    Ranked candidate evaluations, as returned by AgentDecideur.classer_candidats.
+    
+    A plain list that also carries the (N, 3) matrix of global/technical/soft-skills
+    scores in ranked order, so generer_rapport_final does not rebuild it.
+    """
+    
+    def __init__(self, evaluations: List[Dict[str, Any]], report_scores: np.ndarray):
+        super().__init__(evaluations)
+        self.report_scores = report_scores
 
 
 class AgentDecideur:
@@ -13,9 +44,34 @@ class AgentDecideur:
     """
     
     # Scoring weights
-    WEIGHT_PROFIL = 0.3
-    WEIGHT_TECHNIQUE = 0.4
-    WEIGHT_SOFTSKILLS = 0.3
+    WEIGHT_PROFIL, WEIGHT_TECHNIQUE, WEIGHT_SOFTSKILLS = _WEIGHTS
+    
+    # Recommendation buckets: a score >= RECOMMENDATION_THRESHOLDS[i] moves up to label i + 1
+    RECOMMENDATION_THRESHOLDS = np.array([50, 65, 80], dtype=np.float64)
+    RECOMMENDATION_LABELS = ("À rejeter", "À considérer", "Recommandé", "Fortement recommandé")
+    
+    # Justification highlights, keyed by bit in the mask built by _justification_masks
+    JUSTIFICATION_HIGHLIGHTS = (
+        (1, "✓ Excellente adéquation technique"),
+        (2, "✓ Bon profil soft skills"),
+        (4, "✓ Profil expérimenté"),
+        (8, "⚠ Compétences techniques à renforcer"),
+        (16, "⚠ Soft skills à développer"),
+    )
+    
+    # Fixed part of a candidate justification, followed by the highlight lines
+    JUSTIFICATION_TEMPLATE = (
+        "Candidat: {candidate_id}\n"
+        "Score global: {score_global:.1f}/100\n"
+        "Recommandation: {recommandation}\n"
+        "\n"
+        "Détail des scores:\n"
+        "- Profil: {score_profil:.1f}/100 - {commentaire_profil}\n"
+        "- Technique: {score_technique:.1f}/100 - {commentaire_technique}\n"
+        "- Soft Skills: {score_softskills:.1f}/100 - {commentaire_softskills}\n"
+        "\n"
+        "Points forts:"
+    )
     
     def __init__(self, llm=None):
         """
@@ -27,49 +83,121 @@ class AgentDecideur:
         self.llm = llm
     
     def classer_candidats(self,
-                         evaluations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                         evaluations: List[Dict[str, Any]],
+                         top_k: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Rank candidates based on all agent evaluations.
         
         Args:
             evaluations: List of candidate evaluations from all agents
+            top_k: If set, only the top_k best candidates are ranked and returned
+                   (every evaluation is still scored in place)
             
         Returns:
             Ranked list of candidates with scores and justifications
         """
-        # Calculate global scores
-        for eval_data in evaluations:
-            score_global = self._calculate_global_score(
+        if not evaluations:
+            return []
+        
+        if len(evaluations) == 1:
+            # Single candidate: nothing to rank, skip the array setup
+            eval_data = evaluations[0]
+            eval_data["score_global"] = self._calculate_global_score(
                 eval_data.get("score_profil", 0),
                 eval_data.get("score_technique", 0),
                 eval_data.get("score_softskills", 0)
             )
+            eval_data["recommandation"] = self._generate_recommendation(eval_data["score_global"])
+            eval_data["justification"] = self._generer_justification(eval_data)
+            return [eval_data][:top_k]
+        
+        scores = self._scores_matrix(evaluations)
+        
+        # Calculate global scores for all candidates at once. The weighted sum is
+        # done column by column (a BLAS dot may fuse multiply-adds) and rounded
+        # with round2 (np.round scales by 100 first), so scores match
+        # _calculate_global_score exactly.
+        weighted = (
+            scores[:, 0] * self.WEIGHT_PROFIL +
+            scores[:, 1] * self.WEIGHT_TECHNIQUE +
+            scores[:, 2] * self.WEIGHT_SOFTSKILLS
+        )
+        scores_global = round2(weighted)
+        
+        # Bucket all scores against the recommendation thresholds in one call
+        buckets = np.searchsorted(self.RECOMMENDATION_THRESHOLDS, scores_global, side="right")
+        
+        if top_k is not None and top_k < len(evaluations):
+            order = self._top_k_order(scores_global, top_k)
+        else:
+            # Sort by global score (descending, stable for ties)
+            order = np.argsort(-scores_global, kind="stable")
+        
+        masks = self._justification_masks(scores)
+        
+        for eval_data, row, score_global, bucket, mask in zip(
+            evaluations, scores.tolist(), scores_global.tolist(), buckets.tolist(), masks.tolist()
+        ):
             eval_data["score_global"] = score_global
             
             # Generate recommendation
-            eval_data["recommandation"] = self._generate_recommendation(score_global)
+            eval_data["recommandation"] = self.RECOMMENDATION_LABELS[bucket]
             
             # Generate justification
-            eval_data["justification"] = self._generer_justification(eval_data)
+            eval_data["justification"] = self._generer_justification(eval_data, mask, row)
         
-        # Sort by global score (descending)
-        evaluations_sorted = sorted(
-            evaluations,
-            key=lambda x: x.get("score_global", 0),
-            reverse=True
-        )
+        report_scores = np.column_stack((scores_global, scores[:, 1], scores[:, 2]))[order]
+        return RankedCandidates([evaluations[i] for i in order.tolist()], report_scores)
+    
+    @staticmethod
+    def _top_k_order(scores_global: np.ndarray, top_k: int) -> np.ndarray:
+        """
+        Indices of the top_k best scores, in the same order a full stable sort gives.
+        
+        argpartition finds the k-th best score in O(N); every candidate tied with
+        it is kept so the stable sort of that small subset breaks ties by input order.
+        """
+        if top_k <= 0:
+            return np.empty(0, dtype=np.intp)
         
-        return evaluations_sorted
+        kth_score = -np.partition(-scores_global, top_k - 1)[top_k - 1]
+        candidates = np.flatnonzero(scores_global >= kth_score)
+        ranked = candidates[np.argsort(-scores_global[candidates], kind="stable")]
+        return ranked[:top_k]
+    
+    @staticmethod
+    def _justification_masks(scores: np.ndarray) -> np.ndarray:
+        """Strength/weakness bitmask (see JUSTIFICATION_HIGHLIGHTS) for each row of a score matrix."""
+        profil, technique, softskills = scores[:, 0], scores[:, 1], scores[:, 2]
+        return (
+            (technique >= 70).astype(np.uint8) |
+            (softskills >= 70).astype(np.uint8) << 1 |
+            (profil >= 70).astype(np.uint8) << 2 |
+            (technique < 50).astype(np.uint8) << 3 |
+            (softskills < 50).astype(np.uint8) << 4
+        )
+    
+    @staticmethod
+    def _scores_matrix(evaluations: List[Dict[str, Any]]) -> np.ndarray:
+        """Stack profile/technical/soft-skills scores into an (N, 3) matrix."""
+        return np.array(
+            [
+                (e.get("score_profil", 0), e.get("score_technique", 0), e.get("score_softskills", 0))
+                for e in evaluations
+            ],
+            dtype=np.float64
+        )
     
     def _calculate_global_score(self,
                                score_profil: float,
                                score_technique: float,
                                score_softskills: float) -> float:
         """Calculate weighted global score."""
+        weight_profil, weight_technique, weight_softskills = _WEIGHTS
         score = (
-            score_profil * self.WEIGHT_PROFIL +
-            score_technique * self.WEIGHT_TECHNIQUE +
-            score_softskills * self.WEIGHT_SOFTSKILLS
+            score_profil * weight_profil +
+            score_technique * weight_technique +
+            score_softskills * weight_softskills
         )
         return round(score, 2)
     
@@ -84,43 +212,66 @@ class AgentDecideur:
         else:
             return "À rejeter"
     
-    def _generer_justification(self, eval_data: Dict[str, Any]) -> str:
-        """Generate comprehensive justification for candidate."""
-        candidate_id = eval_data.get("candidate_id", "N/A")
-        score_global = eval_data.get("score_global", 0)
-        score_profil = eval_data.get("score_profil", 0)
-        score_technique = eval_data.get("score_technique", 0)
-        score_softskills = eval_data.get("score_softskills", 0)
-        recommandation = eval_data.get("recommandation", "")
-        
-        justification_parts = [
-            f"Candidat: {candidate_id}",
-            f"Score global: {score_global:.1f}/100",
-            f"Recommandation: {recommandation}",
-            "",
-            "Détail des scores:",
-            f"- Profil: {score_profil:.1f}/100 - {eval_data.get('commentaire_profil', '')[:100]}",
-            f"- Technique: {score_technique:.1f}/100 - {eval_data.get('commentaire_technique', '')[:100]}",
-            f"- Soft Skills: {score_softskills:.1f}/100 - {eval_data.get('commentaire_softskills', '')[:100]}",
-            "",
-            "Points forts:"
-        ]
+    def _generer_justification(self,
+                               eval_data: Dict[str, Any],
+                               mask: Optional[int] = None,
+                               scores: Optional[Tuple[float, float, float]] = None) -> str:
+        """
+        Generate comprehensive justification for candidate.
         
-        # Add strengths
-        if score_technique >= 70:
-            justification_parts.append(f"✓ Excellente adéquation technique")
-        if score_softskills >= 70:
-            justification_parts.append(f"✓ Bon profil soft skills")
-        if score_profil >= 70:
-            justification_parts.append(f"✓ Profil expérimenté")
+        Args:
+            eval_data: Candidate evaluation
+            mask: Precomputed strength/weakness bitmask (computed from the scores if omitted)
+            scores: Precomputed (profil, technique, softskills) scores, e.g. a row of
+                    the score matrix (read from eval_data if omitted)
+        """
+        get = eval_data.get
+        candidate_id = get("candidate_id", "N/A")
+        score_global = get("score_global", 0)
+        recommandation = get("recommandation", "")
+        if scores is None:
+            scores = (get("score_profil", 0), get("score_technique", 0), get("score_softskills", 0))
+        score_profil, score_technique, score_softskills = scores
+        
+        # Comments are usually short: only slice (and copy) when they exceed 100 chars
+        commentaire_profil = get("commentaire_profil", "")
+        if len(commentaire_profil) > 100:
+            commentaire_profil = commentaire_profil[:100]
+        commentaire_technique = get("commentaire_technique", "")
+        if len(commentaire_technique) > 100:
+            commentaire_technique = commentaire_technique[:100]
+        commentaire_softskills = get("commentaire_softskills", "")
+        if len(commentaire_softskills) > 100:
+            commentaire_softskills = commentaire_softskills[:100]
         
-        # Add areas for improvement
-        if score_technique < 50:
-            justification_parts.append(f"⚠ Compétences techniques à renforcer")
-        if score_softskills < 50:
-            justification_parts.append(f"⚠ Soft skills à développer")
+        justification = self.JUSTIFICATION_TEMPLATE.format(
+            candidate_id=candidate_id,
+            score_global=score_global,
+            recommandation=recommandation,
+            score_profil=score_profil,
+            commentaire_profil=commentaire_profil,
+            score_technique=score_technique,
+            commentaire_technique=commentaire_technique,
+            score_softskills=score_softskills,
+            commentaire_softskills=commentaire_softskills
+        )
         
-        return "\n".join(justification_parts)
+        # Add strengths, then areas for improvement
+        if mask is None:
+            mask = (
+                (score_technique >= 70) |
+                (score_softskills >= 70) << 1 |
+                (score_profil >= 70) << 2 |
+                (score_technique < 50) << 3 |
+                (score_softskills < 50) << 4
+            )
+        return justification + self._highlight_block(mask)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _highlight_block(mask: int) -> str:
+        """Strength/weakness lines for a highlight bitmask (only 32 possible masks)."""
+        return "".join(f"\n{line}" for bit, line in AgentDecideur.JUSTIFICATION_HIGHLIGHTS if mask & bit)
     
     def generer_rapport_final(self,
                              evaluations: List[Dict[str, Any]],
@@ -144,19 +295,18 @@ class AgentDecideur:
                 "top_candidats": []
             }
         
-        # Calculate statistics
-        scores_globaux = [e.get("score_global", 0) for e in evaluations]
-        scores_techniques = [e.get("score_technique", 0) for e in evaluations]
-        scores_softskills = [e.get("score_softskills", 0) for e in evaluations]
-        
-        stats = {
-            "total_candidats": total_candidats,
-            "score_moyen": sum(scores_globaux) / total_candidats if scores_globaux else 0,
-            "score_max": max(scores_globaux) if scores_globaux else 0,
-            "score_min": min(scores_globaux) if scores_globaux else 0,
-            "score_technique_moyen": sum(scores_techniques) / total_candidats if scores_techniques else 0,
-            "score_softskills_moyen": sum(scores_softskills) / total_candidats if scores_softskills else 0
-        }
+        # Calculate statistics in one pass over a (N, 3) matrix of
+        # global/technical/soft-skills scores, reused from classer_candidats if possible
+        scores = getattr(evaluations, "report_scores", None)
+        if scores is None or len(scores) != total_candidats:
+            scores = np.array(
+                [
+                    (e.get("score_global", 0), e.get("score_technique", 0), e.get("score_softskills", 0))
+                    for e in evaluations
+                ],
+                dtype=np.float64
+            )
+        stats = self._compute_stats(scores)._asdict()
         
         # Top 3 candidates
         top_candidats = evaluations[:3]
@@ -171,6 +321,23 @@ class AgentDecideur:
             "job_profile": job_profile
         }
     
+    @staticmethod
+    def _compute_stats(scores: np.ndarray) -> _Stats:
+        """Reduce a (N, 3) global/technical/soft-skills score matrix to report statistics."""
+        total_candidats = len(scores)
+        score_moyen, score_technique_moyen, score_softskills_moyen = (
+            scores.sum(axis=0) / total_candidats
+        ).tolist()
+        
+        return _Stats(
+            total_candidats=total_candidats,
+            score_moyen=score_moyen,
+            score_max=scores[:, 0].max().item(),
+            score_min=scores[:, 0].min().item(),
+            score_technique_moyen=score_technique_moyen,
+            score_softskills_moyen=score_softskills_moyen
+        )
+    
     def _generate_summary(self,
                          evaluations: List[Dict],
                          job_profile: Dict,
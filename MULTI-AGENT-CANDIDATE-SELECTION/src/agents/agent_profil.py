@@ -5,9 +5,232 @@ Extracts structured profile information with NER, scoring, and skill extraction
 
 import re
 import json
+import hashlib
+import threading
+from datetime import date
+from functools import lru_cache
+from itertools import chain, islice
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from cachetools import LRUCache
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Precompiled patterns (compiled once at import instead of per call)
+_UPPER = "A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ"
+_LOWER = "a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ"
+
+_NAME_TITLE_PREFIX_RE = re.compile(r'^\s*[A-Z\s]+\s*\|\s*')
+_NAME_TITLE_SUFFIX_RE = re.compile(r'\s*\|\s*[A-Z\s]+$')
+_NAME_TITLE_DASH_RE = re.compile(r'^[A-Z\s]+\s*-\s*')
+_NAME_REJECT_RE = re.compile(r'[\d@/]')
+_NAME_ALLCAPS_RE = re.compile(rf'^[{_UPPER}\s]+$')
+_NAME_TITLECASE_RE = re.compile(rf'^[{_UPPER}][{_LOWER}]+(?:\s+[{_UPPER}][{_LOWER}]+)+$')
+
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# French numbers: "0(?<!\w0)" is "\b0" written with the literal first, which lets
+# the regex engine jump straight to "0" characters instead of trying every position
+_PHONE_RES = (
+    re.compile(r'0(?<!\w0)[1-9](?:[.\s-]?\d{2}){4}\b'),
+    re.compile(r'\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,9}')
+)
+_YEAR_RE = re.compile(r'(\d{4})')
+# End dates meaning the position is still ongoing
+_ONGOING_DATES = frozenset({"présent", "aujourd'hui", "present"})
+
+
+def _parse_year(value: str) -> Optional[int]:
+    """Return the first 4-digit year in a date string, or None."""
+    # Bare years ("2019") are the common case and need no regex
+    if len(value) == 4 and value.isdecimal():
+        return int(value)
+    match = _YEAR_RE.search(value)
+    return int(match.group(1)) if match else None
+
+
+# Section headers, looked up in the lowercased CV (first keyword found wins).
+# "expérience professionnelle" is not listed: wherever it occurs, "expérience"
+# is found first, so it could never be the keyword that wins.
+_EXP_SECTION_KEYWORDS = ("expérience", "parcours", "carrière", "work experience")
+_EDU_SECTION_KEYWORDS = ("formation", "éducation", "diplôme", "education", "études")
+
+# Job entries: "Company/Position - Date range" and "Position (YYYY - YYYY)"
+_EXP_ENTRY_RES = (
+    re.compile(r'([A-Z][^.\n]{10,60})\s*[-–]\s*(\d{4}|\d{1,2}/\d{4})\s*[-–]?\s*(\d{4}|\d{1,2}/\d{4}|présent|aujourd\'hui)?', re.MULTILINE),
+    re.compile(r'([A-Z][^.\n]{10,60})\s*\((\d{4})\s*[-–]\s*(\d{4}|présent)\)', re.MULTILINE)
+)
+_EDU_ENTRY_RES = (
+    re.compile(r'(Master|Licence|Bac|Doctorat|PhD|MBA|Ingénieur|École|Université)[^.\n]{0,100}'),
+    re.compile(r'([A-Z][^.\n]{10,60})\s*[-–]\s*(\d{4})')
+)
+
+
+def _normalize_skill_text(text: str) -> str:
+    """
+    Skill matching normalization: "-", "_" and "." become spaces.
+    
+    Chained str.replace runs in C over the whole buffer; str.translate with a
+    mapping table does a per-character lookup and is ~200x slower on a CV.
+    """
+    return text.replace("-", " ").replace("_", " ").replace(".", " ")
+
+
+# Common skills with variations
+SKILL_KEYWORDS = [
+    "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
+    "sql", "nosql", "mongodb", "postgresql", "mysql", "redis",
+    "machine learning", "deep learning", "ml", "ai", "artificial intelligence",
+    "tensorflow", "pytorch", "scikit-learn", "scikit learn", "sklearn", "keras",
+    "pandas", "numpy", "matplotlib", "seaborn",
+    "spark", "apache spark", "pyspark", "hadoop", "kafka",
+    "aws", "azure", "gcp", "google cloud", "cloud computing", "docker", "kubernetes", "k8s",
+    "react", "vue", "angular", "node.js", "nodejs", "django", "flask", "fastapi",
+    "power bi", "powerbi", "tableau", "qlik", "looker", "excel",
+    "git", "github", "gitlab", "ci/cd", "cicd", "jenkins", "terraform", "ansible",
+    "linux", "bash", "shell scripting",
+    "agile", "scrum", "kanban",
+    "mlops", "mlflow", "kubeflow", "airflow", "apache airflow"
+]
+
+
+# Stored names of skills that str.title() does not capitalize properly
+SKILL_DISPLAY_NAMES = {
+    "c++": "C++",
+    "c#": "C#",
+    "ml": "Machine Learning",
+    "ai": "Artificial Intelligence",
+    "ci/cd": "CI/CD",
+    "cicd": "CI/CD",
+    "scikit-learn": "Scikit-learn",
+    "scikit learn": "Scikit-learn",
+    "sklearn": "Scikit-learn",
+    "power bi": "Power BI",
+    "powerbi": "Power BI",
+    "node.js": "Node.js",
+    "nodejs": "Node.js",
+    "apache spark": "Apache Spark",
+    "pyspark": "Apache Spark",
+    "apache airflow": "Apache Airflow"
+}
+
+
+def _skill_display_name(skill: str) -> str:
+    """Normalize skill name for storage (handle special cases)."""
+    display_name = SKILL_DISPLAY_NAMES.get(skill)
+    if display_name is not None:
+        return display_name
+    if "-" in skill:
+        return skill.replace(" ", "-").title()
+    return skill.title()
+
+
+# (alias, -/_ normalized alias, stored name) for every skill keyword
+SKILL_ALIASES = [
+    (skill, skill.replace("-", " ").replace("_", " "), _skill_display_name(skill))
+    for skill in SKILL_KEYWORDS
+]
+
+# Stored skill names in catalog order, the order of extracted skill lists
+_SKILL_DISPLAY_ORDER = tuple(dict.fromkeys(skill_stored for _, _, skill_stored in SKILL_ALIASES))
+
+# A skill matches if it appears in the lowercased text, or its -/_ normalized
+# form appears in the normalized text (where - _ . become spaces). For an alias
+# without a dot the first implies the second, so it is only searched in the
+# normalized text; an alias with a dot can only match the lowercased text.
+_SKILL_RAW_ALIASES = tuple(
+    (skill, skill_stored) for skill, _, skill_stored in SKILL_ALIASES if "." in skill
+)
+_SKILL_NORMALIZED_ALIASES = tuple(
+    (skill_normalized, skill_stored) for skill, skill_normalized, skill_stored in SKILL_ALIASES
+    if "." not in skill
+)
+
+
+def _build_skill_automatons():
+    """
+    Build Aho-Corasick automatons mapping every skill alias to its stored name:
+    one for _SKILL_RAW_ALIASES (lowercased text), one for
+    _SKILL_NORMALIZED_ALIASES (normalized text).
+    """
+    if ahocorasick is None:
+        return None
+    
+    raw_automaton = ahocorasick.Automaton()
+    for alias, skill_stored in _SKILL_RAW_ALIASES:
+        raw_automaton.add_word(alias, skill_stored)
+    normalized_automaton = ahocorasick.Automaton()
+    for alias, skill_stored in _SKILL_NORMALIZED_ALIASES:
+        normalized_automaton.add_word(alias, skill_stored)
+    
+    raw_automaton.make_automaton()
+    normalized_automaton.make_automaton()
+    return raw_automaton, normalized_automaton
+
+
+_SKILL_AUTOMATONS = _build_skill_automatons()
+
+
+@lru_cache(maxsize=1024)
+def normalize_skill_for_match(skill: str) -> str:
+    """Normalize a skill name for job/candidate matching."""
+    normalized = _normalize_skill_text(skill.lower()).strip()
+    if "scikit" in normalized or "sklearn" in normalized:
+        return "scikit learn"
+    if "power bi" in normalized or "powerbi" in normalized:
+        return "power bi"
+    if "node.js" in normalized or "nodejs" in normalized:
+        return "node js"
+    if normalized == "ml":
+        return "machine learning"
+    if normalized == "ai":
+        return "artificial intelligence"
+    return normalized
+
+
+# Language stored in the profile -> keywords looked up in the lowercased CV
+LANGUAGE_KEYWORDS = (
+    ("Français", ("français", "french")),
+    ("Anglais", ("anglais", "english", "anglophone")),
+    ("Espagnol", ("espagnol", "spanish")),
+    ("Allemand", ("allemand", "german", "deutsch")),
+    ("Italien", ("italien", "italian")),
+    ("Chinois", ("chinois", "chinese", "mandarin"))
+)
+
+# Piecewise-linear skill scores: (lowest match ratio, base score, slope) tiers,
+# highest first; a ratio in a tier scores base + (ratio - start) * slope
+REQUIRED_SKILL_TIERS = (
+    (1.0, 40.0, 0),     # All required skills - full points
+    (0.9, 36.0, 40),    # 90%+ match - excellent: 36-40
+    (0.75, 30.0, 40),   # 75-90% match - very good: 30-36
+    (0.6, 22.0, 53.33), # 60-75% match - good: 22-30
+    (0.5, 15.0, 70),    # 50-60% match - acceptable: 15-22
+    (0.0, 0.0, 30)      # Below 50% - poor: 0-15
+)
+OPTIONAL_SKILL_TIERS = (
+    (0.8, 10.0, 0),     # Max bonus
+    (0.6, 7.0, 15),     # 7-10
+    (0.4, 4.0, 15),     # 4-7
+    (0.0, 0.0, 10)      # 0-4
+)
+
+
+def _tiered_score(ratio: float, tiers: tuple) -> float:
+    """Score a match ratio (>= 0) with REQUIRED_SKILL_TIERS or OPTIONAL_SKILL_TIERS."""
+    for start, base, slope in tiers:
+        if ratio >= start:
+            return base + (ratio - start) * slope if slope else base
+    return 0.0
+
+
+# Number of extracted CV profiles kept in memory per AgentProfil
+PROFILE_CACHE_SIZE = 1024
+
 
 class AgentProfil:
     """
@@ -15,19 +238,55 @@ class AgentProfil:
     Extracts structured information and calculates profile score.
     """
     
-    def __init__(self, llm=None):
+    def __init__(self, llm=None, include_raw: bool = False):
         """
         Initialize Agent Profil.
         
         Args:
             llm: Optional LLM for advanced extraction
+            include_raw: Keep the full CV text ("raw_text") and the cover letter
+                         ("lettre_motivation") in profiles. By default only a
+                         content hash and the text length are stored, so large
+                         batches do not keep every CV and letter alive.
         """
         self.llm = llm
+        self.include_raw = include_raw
+        
+        # Job-independent profiles by (CV hash, current year), see extract_profile
+        self._profile_cache = LRUCache(maxsize=PROFILE_CACHE_SIZE)
+        self._profile_cache_lock = threading.Lock()
+    
+    def analyser_candidats(self,
+                          cv_texts: List[str],
+                          lettres_motivation: Optional[List[Optional[str]]] = None,
+                          job_profile: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Analyze a batch of candidate CVs against the same job profile.
+        
+        Args:
+            cv_texts: CV text contents
+            lettres_motivation: Cover letter of each CV (optional)
+            job_profile: Target job profile for matching
+            
+        Returns:
+            Structured candidate profiles, in the order of cv_texts
+        """
+        if lettres_motivation is None:
+            lettres_motivation = [None] * len(cv_texts)
+        
+        # Shared by every candidate of the batch
+        current_year = date.today().year
+        
+        return [
+            self.analyser_candidat(cv_text, lettre_motivation, job_profile, current_year=current_year)
+            for cv_text, lettre_motivation in zip(cv_texts, lettres_motivation)
+        ]
     
     def analyser_candidat(self, 
                          cv_text: str,
                          lettre_motivation: Optional[str] = None,
-                         job_profile: Optional[Dict] = None) -> Dict[str, Any]:
+                         job_profile: Optional[Dict] = None,
+                         current_year: Optional[int] = None) -> Dict[str, Any]:
         """
         Analyze candidate CV and extract structured profile.
         
@@ -35,83 +294,184 @@ class AgentProfil:
             cv_text: CV text content
             lettre_motivation: Cover letter text (optional)
             job_profile: Target job profile for matching
+            current_year: Year used as the end of ongoing positions (defaults to now)
             
         Returns:
             Structured candidate profile with score
         """
+        if current_year is None:
+            current_year = date.today().year
+        text_hash = self._hash_cv(cv_text)
+        
+        # Job-independent extraction (memoized per CV), then job-specific scoring
+        profile = self.extract_profile(cv_text, current_year, text_hash=text_hash)
+        return self._complete_profile(profile, cv_text, text_hash, lettre_motivation, job_profile)
+    
+    def _complete_profile(self,
+                          profile: Dict[str, Any],
+                          cv_text: str,
+                          text_hash: str,
+                          lettre_motivation: Optional[str],
+                          job_profile: Optional[Dict]) -> Dict[str, Any]:
+        """Add the job score and raw input fields to an extracted profile."""
+        profile.update(self.score_against(profile, job_profile))
+        
+        if self.include_raw:
+            profile["lettre_motivation"] = lettre_motivation or ""
+            profile["raw_text"] = cv_text
+        else:
+            profile["raw_text_hash"] = text_hash
+            profile["raw_text_length"] = len(cv_text)
+        
+        return profile
+    
+    @staticmethod
+    def _hash_cv(cv_text: str) -> str:
+        """Content hash of a CV (profile cache key and raw_text_hash)."""
+        return hashlib.blake2b(cv_text.encode("utf-8"), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _copy_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy an extracted profile and its containers (cached profiles stay untouched)."""
+        return {
+            **profile,
+            "experience": [dict(exp) for exp in profile["experience"]],
+            "education": [dict(edu) for edu in profile["education"]],
+            "skills_list": list(profile["skills_list"]),
+            "languages": list(profile["languages"])
+        }
+    
+    def extract_profile(self,
+                        cv_text: str,
+                        current_year: Optional[int] = None,
+                        text_hash: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Extract the job-independent part of a candidate profile.
+        
+        Results are memoized by CV content, so analysing the same CV against
+        several job profiles only extracts it once.
+        
+        Args:
+            cv_text: CV text content
+            current_year: Year used as the end of ongoing positions (defaults to now)
+            text_hash: Precomputed BLAKE2b hex digest of cv_text (optional)
+            
+        Returns:
+            Profile fields (id, nom, email, telephone, years_experience,
+            experience, education, skills_list, languages), safe to modify
+        """
+        if current_year is None:
+            current_year = date.today().year
+        if text_hash is None:
+            text_hash = self._hash_cv(cv_text)
+        
+        key = (text_hash, current_year)
+        with self._profile_cache_lock:
+            profile = self._profile_cache.get(key)
+        if profile is None:
+            profile = self._extract_profile(cv_text, current_year)
+            with self._profile_cache_lock:
+                self._profile_cache[key] = profile
+        
+        # Copy the containers so callers cannot alter the cached profile
+        return self._copy_profile(profile)
+    
+    def _extract_profile(self, cv_text: str, current_year: int) -> Dict[str, Any]:
+        """Run every extractor on a CV (uncached, see extract_profile)."""
         # Extract basic information
         nom = self._extract_name(cv_text)
         email = self._extract_email(cv_text)
         telephone = self._extract_phone(cv_text)
         
+        # Lowercased copy of the CV, shared by the extractors below
+        cv_text_lower = cv_text.lower()
+        
         # Extract experience
-        experience = self._extract_experience(cv_text)
-        years_experience = self._calculate_years_experience(experience)
+        experience = self._extract_experience(cv_text, cv_text_lower)
+        years_experience = self._calculate_years_experience(experience, current_year)
         
         # Extract education
-        education = self._extract_education(cv_text)
+        education = self._extract_education(cv_text, cv_text_lower)
         
-        # Extract skills
-        skills_list = self._extract_skills(cv_text)
+        # Extract skills and languages
+        skills_list = self._extract_skills(cv_text, cv_text_lower)
+        languages = self._extract_languages(cv_text, cv_text_lower)
         
-        # Extract languages
-        languages = self._extract_languages(cv_text)
+        return {
+            "id": self._generate_id(nom, email),
+            "nom": nom,
+            "email": email,
+            "telephone": telephone,
+            "years_experience": years_experience,
+            "experience": experience,
+            "education": education,
+            "skills_list": skills_list,
+            "languages": languages
+        }
+    
+    def score_against(self, profile: Dict[str, Any], job_profile: Optional[Dict]) -> Dict[str, Any]:
+        """
+        Score an extracted profile against a job profile.
         
+        Args:
+            profile: Profile returned by extract_profile
+            job_profile: Target job profile for matching
+            
+        Returns:
+            Dictionary with score_profil and commentaire_profil
+        """
         # Calculate profile score
         score_profil = self._calculate_profile_score(
-            years_experience, skills_list, education, job_profile
+            profile["years_experience"], profile["skills_list"], profile["education"], job_profile
         )
         
         # Generate comment
         commentaire = self._generate_comment(
-            nom, years_experience, skills_list, job_profile, score_profil
+            profile["nom"], profile["years_experience"], profile["skills_list"], job_profile, score_profil
         )
         
         return {
-            "id": self._generate_id(nom, email),
-            "nom": nom,
-            "email": email,
-            "telephone": telephone,
-            "years_experience": years_experience,
-            "experience": experience,
-            "education": education,
-            "skills_list": skills_list,
-            "languages": languages,
             "score_profil": score_profil,
-            "commentaire_profil": commentaire,
-            "raw_text": cv_text,
-            "lettre_motivation": lettre_motivation or ""
+            "commentaire_profil": commentaire
         }
     
     def _extract_name(self, text: str) -> str:
         """Extract candidate name (usually first line)."""
-        lines = text.split('\n')
+        # Try first few lines (only those are split off the CV)
+        lines = text.split('\n', 10)
         
-        # Try first few lines
         for line in lines[:10]:
             line = line.strip()
             if not line:
                 continue
-                
-            # Remove common prefixes/suffixes
-            line_clean = re.sub(r'^\s*[A-Z\s]+\s*\|\s*', '', line)  # Remove "TITLE |" prefix
-            line_clean = re.sub(r'\s*\|\s*[A-Z\s]+$', '', line_clean)  # Remove "| TITLE" suffix
-            line_clean = re.sub(r'^[A-Z\s]+\s*-\s*', '', line_clean)  # Remove "TITLE -" prefix
+            
+            # Cheap prefilter: "@", "/" and digits survive the cleanup below and
+            # can never be part of a name, so such lines are skipped right away
+            if _NAME_REJECT_RE.search(line):
+                continue
+            
+            # Remove common prefixes/suffixes (only possible with "|" or "-")
+            line_clean = line
+            if '|' in line_clean:
+                line_clean = _NAME_TITLE_PREFIX_RE.sub('', line_clean)  # Remove "TITLE |" prefix
+                line_clean = _NAME_TITLE_SUFFIX_RE.sub('', line_clean)  # Remove "| TITLE" suffix
+            if '-' in line_clean:
+                line_clean = _NAME_TITLE_DASH_RE.sub('', line_clean)  # Remove "TITLE -" prefix
             line_clean = line_clean.strip()
             
-            # Skip if it's clearly not a name (contains @, http, digits, etc.)
-            if '@' in line_clean or 'http' in line_clean.lower() or re.search(r'\d{4}', line_clean):
+            # Skip if it's clearly not a name (contains http, etc.)
+            if 'http' in line_clean.lower():
                 continue
             
             if len(line_clean) > 3 and len(line_clean) < 50:
                 # Pattern 1: All caps (ALEXANDRE MARTIN, SARAH BERNARD)
-                if re.match(r'^[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ\s]+$', line_clean):
+                if _NAME_ALLCAPS_RE.match(line_clean):
                     words = line_clean.split()
                     if 2 <= len(words) <= 4:  # Typically 2-4 words for a name
                         return line_clean.title()
                 
                 # Pattern 2: Title case (Alexandre Martin, Sarah Bernard)
-                if re.match(r'^[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ][a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]+(?:\s+[A-ZÀÁÂÃÄÅÆÇÈÉÊËÌÍÎÏÐÑÒÓÔÕÖØÙÚÛÜÝÞ][a-zàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿ]+)+$', line_clean):
+                if _NAME_TITLECASE_RE.match(line_clean):
                     words = line_clean.split()
                     if 2 <= len(words) <= 4:
                         return line_clean
@@ -120,42 +480,39 @@ class AgentProfil:
         email = self._extract_email(text)
         if email:
             # Extract name from email (e.g., "alexandre.martin@email.com" -> "Alexandre Martin")
-            email_prefix = email.split('@')[0]
-            if '.' in email_prefix:
-                name_parts = email_prefix.split('.')
-                if len(name_parts) == 2:
-                    return f"{name_parts[0].title()} {name_parts[1].title()}"
+            email_prefix, _, _ = email.partition('@')
+            first_name, dot, last_name = email_prefix.partition('.')
+            # Exactly two dot-separated parts
+            if dot and '.' not in last_name:
+                return f"{first_name.title()} {last_name.title()}"
         
         return "Nom non trouvé"
     
     def _extract_email(self, text: str) -> str:
         """Extract email address."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else ""
+        # First match only: search stops there instead of scanning the whole CV
+        match = _EMAIL_RE.search(text)
+        return match.group(0) if match else ""
     
     def _extract_phone(self, text: str) -> str:
         """Extract phone number."""
-        phone_patterns = [
-            r'\b0[1-9](?:[.\s-]?\d{2}){4}\b',
-            r'\+\d{1,3}[\s.-]?\d{1,4}[\s.-]?\d{1,4}[\s.-]?\d{1,9}'
-        ]
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                return matches[0]
+        for pattern in _PHONE_RES:
+            match = pattern.search(text)
+            if match:
+                return match.group(0)
         return ""
     
-    def _extract_experience(self, text: str) -> List[Dict]:
-        """Extract work experience."""
+    def _extract_experience(self, text: str, text_lower: Optional[str] = None) -> List[Dict]:
+        """Extract work experience (text_lower: precomputed text.lower(), optional)."""
         experience = []
+        if text_lower is None:
+            text_lower = text.lower()
         
-        # Look for experience section
-        exp_keywords = ["expérience", "expérience professionnelle", "parcours", "carrière", "work experience"]
+        # Look for experience section (first keyword found wins, in list order)
         exp_section = ""
         
-        for keyword in exp_keywords:
-            idx = text.lower().find(keyword.lower())
+        for keyword in _EXP_SECTION_KEYWORDS:
+            idx = text_lower.find(keyword)
             if idx != -1:
                 # Extract section
                 start = idx
@@ -168,64 +525,77 @@ class AgentProfil:
         if not exp_section:
             exp_section = text
         
-        # Extract job entries
-        # Pattern: Company/Position - Date range
-        patterns = [
-            r'([A-Z][^.\n]{10,60})\s*[-–]\s*(\d{4}|\d{1,2}/\d{4})\s*[-–]?\s*(\d{4}|\d{1,2}/\d{4}|présent|aujourd\'hui)?',
-            r'([A-Z][^.\n]{10,60})\s*\((\d{4})\s*[-–]\s*(\d{4}|présent)\)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.finditer(pattern, exp_section, re.MULTILINE)
-            for match in matches:
-                experience.append({
-                    "poste": match.group(1).strip(),
-                    "date_debut": match.group(2),
-                    "date_fin": match.group(3) if len(match.groups()) > 2 else "présent"
-                })
-        
-        return experience[:10]  # Limit to 10 experiences
+        # Every job entry pattern needs a 4-digit year: without one, skip the
+        # (costlier) entry patterns that would try every capitalized position
+        if not _YEAR_RE.search(exp_section):
+            return experience
+        
+        # Extract job entries (limited to 10; patterns are scanned lazily, in
+        # order, and stop as soon as the limit is reached)
+        matches = chain.from_iterable(pattern.finditer(exp_section) for pattern in _EXP_ENTRY_RES)
+        for match in islice(matches, 10):
+            # Both patterns capture (position, start date, end date)
+            experience.append({
+                "poste": match.group(1).strip(),
+                "date_debut": match.group(2),
+                "date_fin": match.group(3)
+            })
+        
+        return experience
     
-    def _calculate_years_experience(self, experience: List[Dict]) -> float:
+    def _calculate_years_experience(self,
+                                    experience: List[Dict],
+                                    current_year: Optional[int] = None) -> float:
         """Calculate total years of experience."""
         if not experience:
             return 0.0
         
-        total_years = 0.0
-        for exp in experience:
-            try:
-                date_debut = exp.get("date_debut", "")
-                date_fin = exp.get("date_fin", "présent")
-                
-                # Extract year
-                year_debut = re.search(r'(\d{4})', date_debut)
-                if year_debut:
-                    year_debut = int(year_debut.group(1))
-                    if date_fin.lower() in ["présent", "aujourd'hui", "present"]:
-                        from datetime import datetime
-                        year_fin = datetime.now().year
-                    else:
-                        year_fin_match = re.search(r'(\d{4})', date_fin)
-                        if year_fin_match:
-                            year_fin = int(year_fin_match.group(1))
-                        else:
-                            continue
-                    
-                    total_years += (year_fin - year_debut)
-            except:
-                continue
+        total_years = float(sum(
+            year_fin - year_debut
+            for year_debut, year_fin in self._experience_year_spans(experience, current_year)
+        ))
         
         return max(0.0, total_years)
     
-    def _extract_education(self, text: str) -> List[Dict]:
-        """Extract education information."""
+    def _experience_year_spans(self, experience: List[Dict], current_year: Optional[int] = None):
+        """Yield (start year, end year) for each experience entry with parseable dates."""
+        if current_year is None:
+            current_year = date.today().year
+        
+        for exp in experience:
+            date_debut = exp.get("date_debut", "")
+            date_fin = exp.get("date_fin", "présent")
+            # Unmatched optional groups leave None here, and an empty date has
+            # no year: skip the entry
+            if not (date_debut and date_fin and
+                    isinstance(date_debut, str) and isinstance(date_fin, str)):
+                continue
+            
+            # Extract year
+            year_debut = _parse_year(date_debut)
+            if year_debut is None:
+                continue
+            # Exact spelling first, lowercasing only for other forms ("Présent")
+            if date_fin in _ONGOING_DATES or date_fin.lower() in _ONGOING_DATES:
+                year_fin = current_year
+            else:
+                year_fin = _parse_year(date_fin)
+                if year_fin is None:
+                    continue
+            
+            yield year_debut, year_fin
+    
+    def _extract_education(self, text: str, text_lower: Optional[str] = None) -> List[Dict]:
+        """Extract education information (text_lower: precomputed text.lower(), optional)."""
         education = []
+        if text_lower is None:
+            text_lower = text.lower()
         
-        edu_keywords = ["formation", "éducation", "diplôme", "éducation", "education", "études"]
+        # First keyword found wins, in list order
         edu_section = ""
         
-        for keyword in edu_keywords:
-            idx = text.lower().find(keyword.lower())
+        for keyword in _EDU_SECTION_KEYWORDS:
+            idx = text_lower.find(keyword)
             if idx != -1:
                 start = idx
                 end = text.find("\n\n", start + 100)
@@ -237,96 +607,51 @@ class AgentProfil:
         if not edu_section:
             edu_section = text
         
-        # Extract degree and school
-        degree_patterns = [
-            r'(Master|Licence|Bac|Doctorat|PhD|MBA|Ingénieur|École|Université)[^.\n]{0,100}',
-            r'([A-Z][^.\n]{10,60})\s*[-–]\s*(\d{4})'
-        ]
-        
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, edu_section)
-            for match in matches:
-                education.append({
-                    "diplome": match.group(0).strip()[:100]
-                })
+        # Extract degree and school (limited to 5, scanned lazily like experience)
+        matches = chain.from_iterable(pattern.finditer(edu_section) for pattern in _EDU_ENTRY_RES)
+        for match in islice(matches, 5):
+            education.append({
+                "diplome": match.group(0).strip()[:100]
+            })
         
-        return education[:5]
+        return education
     
-    def _extract_skills(self, text: str) -> List[str]:
-        """Extract technical skills."""
-        skills = []
-        text_lower = text.lower()
+    def _extract_skills(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Extract technical skills (text_lower: precomputed text.lower(), optional)."""
+        if text_lower is None:
+            text_lower = text.lower()
         
         # Normalize text for better matching (replace common variations)
-        text_normalized = text_lower.replace("-", " ").replace("_", " ").replace(".", " ")
-        
-        # Common skills with variations
-        skill_keywords = [
-            "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-            "sql", "nosql", "mongodb", "postgresql", "mysql", "redis",
-            "machine learning", "deep learning", "ml", "ai", "artificial intelligence",
-            "tensorflow", "pytorch", "scikit-learn", "scikit learn", "sklearn", "keras",
-            "pandas", "numpy", "matplotlib", "seaborn",
-            "spark", "apache spark", "pyspark", "hadoop", "kafka",
-            "aws", "azure", "gcp", "google cloud", "cloud computing", "docker", "kubernetes", "k8s",
-            "react", "vue", "angular", "node.js", "nodejs", "django", "flask", "fastapi",
-            "power bi", "powerbi", "tableau", "qlik", "looker", "excel",
-            "git", "github", "gitlab", "ci/cd", "cicd", "jenkins", "terraform", "ansible",
-            "linux", "bash", "shell scripting",
-            "agile", "scrum", "kanban",
-            "mlops", "mlflow", "kubeflow", "airflow", "apache airflow"
-        ]
-        
-        for skill in skill_keywords:
-            skill_normalized = skill.replace("-", " ").replace("_", " ")
-            # Check both original and normalized versions
-            if skill in text_lower or skill_normalized in text_normalized:
-                # Normalize skill name for storage (handle special cases)
-                if skill == "c++":
-                    skill_stored = "C++"
-                elif skill == "c#":
-                    skill_stored = "C#"
-                elif skill == "ml":
-                    skill_stored = "Machine Learning"
-                elif skill == "ai":
-                    skill_stored = "Artificial Intelligence"
-                elif skill == "ci/cd" or skill == "cicd":
-                    skill_stored = "CI/CD"
-                elif skill == "scikit-learn" or skill == "scikit learn" or skill == "sklearn":
-                    skill_stored = "Scikit-learn"
-                elif skill == "power bi" or skill == "powerbi":
-                    skill_stored = "Power BI"
-                elif skill == "node.js" or skill == "nodejs":
-                    skill_stored = "Node.js"
-                elif skill == "apache spark" or skill == "pyspark":
-                    skill_stored = "Apache Spark"
-                elif skill == "apache airflow":
-                    skill_stored = "Apache Airflow"
-                elif "-" in skill:
-                    skill_stored = skill.replace(" ", "-").title()
-                else:
-                    skill_stored = skill.title()
-                skills.append(skill_stored)
-        
-        return list(set(skills))
+        text_normalized = _normalize_skill_text(text_lower)
+        
+        if _SKILL_AUTOMATONS is not None:
+            # One automaton pass per text finds every alias at once
+            raw_automaton, normalized_automaton = _SKILL_AUTOMATONS
+            skills = {skill_stored for _, skill_stored in raw_automaton.iter(text_lower)}
+            skills.update(skill_stored for _, skill_stored in normalized_automaton.iter(text_normalized))
+            return [skill for skill in _SKILL_DISPLAY_ORDER if skill in skills]
+        
+        # One substring scan per alias, skipped when another alias of the same
+        # skill already matched
+        skills = set()
+        for alias, skill_stored in _SKILL_RAW_ALIASES:
+            if skill_stored not in skills and alias in text_lower:
+                skills.add(skill_stored)
+        for alias, skill_stored in _SKILL_NORMALIZED_ALIASES:
+            if skill_stored not in skills and alias in text_normalized:
+                skills.add(skill_stored)
+        
+        return [skill for skill in _SKILL_DISPLAY_ORDER if skill in skills]
     
-    def _extract_languages(self, text: str) -> List[str]:
-        """Extract languages."""
+    def _extract_languages(self, text: str, text_lower: Optional[str] = None) -> List[str]:
+        """Extract languages (text_lower: precomputed text.lower(), optional)."""
         languages = []
-        text_lower = text.lower()
-        
-        lang_keywords = {
-            "français": ["français", "french"],
-            "anglais": ["anglais", "english", "anglophone"],
-            "espagnol": ["espagnol", "spanish"],
-            "allemand": ["allemand", "german", "deutsch"],
-            "italien": ["italien", "italian"],
-            "chinois": ["chinois", "chinese", "mandarin"]
-        }
+        if text_lower is None:
+            text_lower = text.lower()
         
-        for lang, keywords in lang_keywords.items():
+        for lang, keywords in LANGUAGE_KEYWORDS:
             if any(kw in text_lower for kw in keywords):
-                languages.append(lang.title())
+                languages.append(lang)
         
         return languages if languages else ["Français"]
     
@@ -358,77 +683,21 @@ class AgentProfil:
         required_skills = job_profile.get("skills_obligatoires", [])
         optional_skills = job_profile.get("skills_optionnelles", [])
         
-        # Normalize skills for matching
-        def normalize_skill_for_match(skill: str) -> str:
-            normalized = skill.lower().replace("-", " ").replace("_", " ").replace(".", " ").strip()
-            if "scikit" in normalized or "sklearn" in normalized:
-                return "scikit learn"
-            if "power bi" in normalized or "powerbi" in normalized:
-                return "power bi"
-            if "node.js" in normalized or "nodejs" in normalized:
-                return "node js"
-            if normalized == "ml":
-                return "machine learning"
-            if normalized == "ai":
-                return "artificial intelligence"
-            return normalized
-        
-        matched_required = 0
-        for skill_req in required_skills:
-            skill_req_norm = normalize_skill_for_match(skill_req)
-            for skill_cand in skills:
-                skill_cand_norm = normalize_skill_for_match(skill_cand)
-                if (skill_req_norm == skill_cand_norm or 
-                    skill_req_norm in skill_cand_norm or 
-                    skill_cand_norm in skill_req_norm):
-                    matched_required += 1
-                    break
-        
-        matched_optional = 0
-        for skill_opt in optional_skills:
-            skill_opt_norm = normalize_skill_for_match(skill_opt)
-            for skill_cand in skills:
-                skill_cand_norm = normalize_skill_for_match(skill_cand)
-                if (skill_opt_norm == skill_cand_norm or 
-                    skill_opt_norm in skill_cand_norm or 
-                    skill_cand_norm in skill_opt_norm):
-                    matched_optional += 1
-                    break
+        # Normalize candidate skills once for matching
+        skills_norm = {normalize_skill_for_match(skill) for skill in skills}
+        matched_required = self._count_matched_skills(required_skills, skills_norm)
+        matched_optional = self._count_matched_skills(optional_skills, skills_norm)
         
         if required_skills:
             match_ratio_required = matched_required / len(required_skills)
             
             # More generous scoring for required skills (40 points max)
-            if match_ratio_required >= 1.0:
-                # All required skills - full points
-                skills_score = 40.0
-            elif match_ratio_required >= 0.9:
-                # 90%+ match - excellent
-                skills_score = 36.0 + (match_ratio_required - 0.9) * 40  # 36-40
-            elif match_ratio_required >= 0.75:
-                # 75-90% match - very good
-                skills_score = 30.0 + (match_ratio_required - 0.75) * 40  # 30-36
-            elif match_ratio_required >= 0.6:
-                # 60-75% match - good
-                skills_score = 22.0 + (match_ratio_required - 0.6) * 53.33  # 22-30
-            elif match_ratio_required >= 0.5:
-                # 50-60% match - acceptable
-                skills_score = 15.0 + (match_ratio_required - 0.5) * 70  # 15-22
-            else:
-                # Below 50% - poor
-                skills_score = match_ratio_required * 30  # 0-15
+            skills_score = _tiered_score(match_ratio_required, REQUIRED_SKILL_TIERS)
             
             # Optional skills bonus (10 points max, more generous)
             if optional_skills:
                 match_ratio_optional = matched_optional / len(optional_skills)
-                if match_ratio_optional >= 0.8:
-                    optional_score = 10.0  # Max bonus
-                elif match_ratio_optional >= 0.6:
-                    optional_score = 7.0 + (match_ratio_optional - 0.6) * 15  # 7-10
-                elif match_ratio_optional >= 0.4:
-                    optional_score = 4.0 + (match_ratio_optional - 0.4) * 15  # 4-7
-                else:
-                    optional_score = match_ratio_optional * 10  # 0-4
+                optional_score = _tiered_score(match_ratio_optional, OPTIONAL_SKILL_TIERS)
             else:
                 optional_score = 0
             
@@ -444,6 +713,30 @@ class AgentProfil:
         
         return min(100.0, score)
     
+    @staticmethod
+    def _count_matched_skills(job_skills: List[str], skills_norm: set) -> int:
+        """
+        Count job skills matched by a candidate skill (equal, or one contained in the other).
+        
+        Args:
+            job_skills: Required or optional skills of the job
+            skills_norm: Candidate skills, already normalized with normalize_skill_for_match
+        """
+        if not skills_norm:
+            return 0
+        
+        # "\0" never occurs in a skill name: a substring of the joined text is a
+        # substring of one candidate skill
+        skills_blob = "\0".join(skills_norm)
+        matched = 0
+        for skill in job_skills:
+            skill_norm = normalize_skill_for_match(skill)
+            if (skill_norm in skills_norm or
+                    ("\0" not in skill_norm and skill_norm in skills_blob) or
+                    any(skill_cand_norm in skill_norm for skill_cand_norm in skills_norm)):
+                matched += 1
+        return matched
+    
     def _generate_comment(self, 
                          nom: str,
                          years_experience: float,
@@ -451,23 +744,24 @@ class AgentProfil:
                          job_profile: Optional[Dict],
                          score: float) -> str:
         """Generate profile comment."""
-        comment_parts = [f"Profil de {nom}:"]
-        
-        comment_parts.append(f"Expérience: {years_experience:.1f} ans")
-        comment_parts.append(f"Compétences: {', '.join(skills[:10])}")
-        comment_parts.append(f"Score de profil: {score:.1f}/100")
-        
-        if job_profile:
+        matched_part = ""
+        if job_profile and skills:
             required = job_profile.get("skills_obligatoires", [])
-            matched = [s for s in required if any(s.lower() in skill.lower() for skill in skills)]
+            # "\0" never occurs in a skill name: a substring of the joined text is a
+            # substring of one candidate skill
+            skills_blob = "\0".join([skill.lower() for skill in skills])
+            matched = [s for s in required if "\0" not in s and s.lower() in skills_blob]
             if matched:
-                comment_parts.append(f"Compétences requises correspondantes: {', '.join(matched)}")
+                matched_part = f" | Compétences requises correspondantes: {', '.join(matched)}"
         
-        return " | ".join(comment_parts)
+        return (f"Profil de {nom}: | Expérience: {years_experience:.1f} ans | "
+                f"Compétences: {', '.join(skills[:10])} | "
+                f"Score de profil: {score:.1f}/100{matched_part}")
     
     def _generate_id(self, nom: str, email: str) -> str:
         """Generate candidate ID."""
         if email:
-            return email.split('@')[0]
+            local_part, _, _ = email.partition('@')
+            return local_part
         return nom.lower().replace(' ', '_')
 
@@ -5,8 +5,241 @@ Extracts structured profile requirements from job postings
 
 import json
 import re
+import hashlib
+import threading
+from collections import Counter
 from typing import Dict, List, Any, Optional
 
+from cachetools import LRUCache
+
+try:
+    import ahocorasick  # pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# Precompiled patterns (compiled once at import instead of per call)
+_EXPERIENCE_RES = (
+    re.compile(r"(\d+)\s*ans?\s*d['\s]expérience"),
+    re.compile(r"(\d+)\s*ans?\s*d['\s]exp"),
+    re.compile(r"minimum\s*(\d+)\s*ans?"),
+    re.compile(r"au moins\s*(\d+)\s*ans?"),
+    re.compile(r"(\d+)\+?\s*ans?\s*d['\s]expérience")
+)
+_SALARY_RES = (
+    re.compile(r"(\d+)\s*€?\s*-\s*(\d+)\s*€"),
+    re.compile(r"(\d+)\s*k?\s*€?\s*/\s*an"),
+    re.compile(r"salaire\s*:\s*(\d+)\s*€")
+)
+_KEYWORD_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Common words ignored by _extract_keywords
+_STOP_WORDS = frozenset({"dans", "pour", "avec", "sont", "cette", "plus", "tous", "toutes"})
+
+# Common technical skills with variations
+SKILL_KEYWORDS = [
+    "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
+    "sql", "nosql", "mongodb", "postgresql", "mysql",
+    "machine learning", "ml", "deep learning", "tensorflow", "pytorch", "scikit-learn", "scikit learn", "sklearn",
+    "pandas", "numpy", "spark", "apache spark", "pyspark", "hadoop",
+    "aws", "azure", "gcp", "google cloud", "cloud", "docker", "kubernetes", "k8s",
+    "react", "vue", "angular", "node.js", "nodejs", "django", "flask",
+    "power bi", "powerbi", "tableau", "qlik", "looker",
+    "git", "github", "ci/cd", "cicd", "jenkins", "terraform", "ansible",
+    "mlops", "mlflow", "kubeflow", "airflow", "apache airflow",
+    "r"
+]
+
+# Normalize skill names for matching
+SKILL_NORMALIZATIONS = {
+    "scikit-learn": ["scikit-learn", "scikit learn", "sklearn"],
+    "apache spark": ["apache spark", "spark", "pyspark"],
+    "power bi": ["power bi", "powerbi"],
+    "node.js": ["node.js", "nodejs"],
+    "machine learning": ["machine learning", "ml"],
+    "ci/cd": ["ci/cd", "cicd"],
+    "apache airflow": ["apache airflow", "airflow"]
+}
+
+# Every spelling searched in job descriptions
+_SKILL_VARIATIONS = frozenset(SKILL_KEYWORDS).union(*SKILL_NORMALIZATIONS.values())
+
+
+# Section headers of job descriptions, highest priority first
+REQUIRED_SECTION_MARKERS = (
+    "compétences techniques requises", "compétences requises",
+    "requis", "obligatoire", "must have", "nécessaire"
+)
+OPTIONAL_SECTION_MARKERS = (
+    "compétences appréciées", "compétences optionnelles",
+    "optionnel", "nice to have", "souhaitable", "bonus", "apprécié"
+)
+# Headers closing a section (the nearest one after its start wins)
+REQUIRED_SECTION_END_MARKERS = ("compétences appréciées", "soft skills", "langues", "avantages")
+OPTIONAL_SECTION_END_MARKERS = ("soft skills", "langues", "avantages")
+
+
+def _find_first_marker(desc_lower: str, markers: tuple) -> int:
+    """Position of the first marker (in priority order) found in the text, -1 if none."""
+    for marker in markers:
+        idx = desc_lower.find(marker)
+        if idx != -1:
+            return idx
+    return -1
+
+
+def _skill_variations(skill: str) -> tuple:
+    """The skill followed by the variants of its first normalization group."""
+    for variants in SKILL_NORMALIZATIONS.values():
+        if skill in variants:
+            return (skill, *variants)
+    return (skill,)
+
+
+# (skill, variations to check) for every skill, in SKILL_KEYWORDS order
+_SKILL_KEYWORD_VARIATIONS = tuple((skill, _skill_variations(skill)) for skill in SKILL_KEYWORDS)
+
+# Display names of the special cases (other skills use skill.title())
+SKILL_DISPLAY_NAMES = {
+    "scikit-learn": "Scikit-learn", "scikit learn": "Scikit-learn", "sklearn": "Scikit-learn",
+    "power bi": "Power BI", "powerbi": "Power BI",
+    "node.js": "Node.js", "nodejs": "Node.js",
+    "apache spark": "Apache Spark", "pyspark": "Apache Spark", "spark": "Apache Spark",  # Normalize all spark variants
+    "apache airflow": "Apache Airflow", "airflow": "Apache Airflow",
+    "ci/cd": "CI/CD", "cicd": "CI/CD",
+    "ml": "Machine Learning", "machine learning": "Machine Learning",
+    "aws": "Cloud", "azure": "Cloud", "gcp": "Cloud", "google cloud": "Cloud",  # Group cloud providers
+    "mlops": "MLOps", "mlflow": "MLOps", "kubeflow": "MLOps"  # Group MLOps tools
+}
+
+# Skills required by default when no section or context decides
+CORE_SKILLS = ("python", "sql", "scikit-learn", "tensorflow", "pytorch", "spark", "hadoop", "postgresql", "mongodb", "git")
+
+# Variations containing a core skill (e.g. "pyspark", "github")
+_CORE_SKILL_VARIATIONS = frozenset(
+    variation for variation in _SKILL_VARIATIONS
+    if any(core_skill in variation for core_skill in CORE_SKILLS)
+)
+
+
+def _build_skill_automaton():
+    """Build an Aho-Corasick automaton over every skill variation (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for variation in _SKILL_VARIATIONS:
+        automaton.add_word(variation, variation)
+    automaton.make_automaton()
+    return automaton
+
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+
+def _find_skill_variations(desc_lower: str) -> Dict[str, List[int]]:
+    """
+    Find every skill variation in a lowercased description.
+    
+    Returns:
+        Start positions of each variation found, in increasing order and
+        non-overlapping (the same positions as re.finditer on the variation)
+    """
+    occurrences = {}
+    
+    if _SKILL_AUTOMATON is not None:
+        # One pass over the text finds all variations at once
+        for end_idx, variation in _SKILL_AUTOMATON.iter(desc_lower):
+            start = end_idx - len(variation) + 1
+            positions = occurrences.setdefault(variation, [])
+            if not positions or start >= positions[-1] + len(variation):
+                positions.append(start)
+        return occurrences
+    
+    for variation in _SKILL_VARIATIONS:
+        start = desc_lower.find(variation)
+        if start == -1:
+            continue
+        positions = occurrences[variation] = []
+        while start != -1:
+            positions.append(start)
+            start = desc_lower.find(variation, start + len(variation))
+    return occurrences
+
+
+def _add_skill(skills: Dict[str, str], skill_name: str) -> None:
+    """
+    Add a skill last to a lowercased name -> name mapping.
+    
+    Any duplicate or more specific version already listed (whose name
+    contains this one) is removed first.
+    """
+    skill_lower = skill_name.lower()
+    for key in [key for key in skills if skill_lower in key]:
+        del skills[key]
+    skills[skill_lower] = skill_name
+
+
+# Keyword tables, highest priority first (first keyword found wins)
+JOB_TITLES = (
+    "data scientist", "data engineer", "data analyst",
+    "machine learning engineer", "ml engineer",
+    "developpeur", "developer", "ingenieur", "engineer",
+    "product manager", "project manager",
+    "qa engineer", "test engineer", "quality assurance",
+    "devops engineer", "cloud engineer",
+    "full stack", "frontend", "backend",
+    "cybersecurity", "security engineer"
+)
+SENIORITY_KEYWORDS = (
+    ("senior", ("senior", "sénior", "expérimenté", "expert")),
+    ("junior", ("junior", "débutant", "entry level", "stagiaire")),
+    ("mid", ("mid", "intermédiaire"))
+)
+LANGUAGE_KEYWORDS = ("français", "anglais", "espagnol", "allemand", "italien", "chinois")
+LOCATION_KEYWORDS = ("paris", "lyon", "marseille", "toulouse", "remote", "télétravail")
+CONTRACT_KEYWORDS = (
+    ("cdi", ("cdi", "permanent")),
+    ("cdd", ("cdd", "temporary", "temporaire")),
+    ("stage", ("stage", "internship", "stagiaire")),
+    ("alternance", ("alternance", "apprentissage", "apprenticeship")),
+    ("freelance", ("freelance", "consultant", "indépendant"))
+)
+
+_JOB_TITLE_NAMES = {title: title.title() for title in JOB_TITLES}
+
+# Every keyword looked up by the title/seniority/language/location/contract extractors
+_DESCRIPTION_KEYWORDS = frozenset(JOB_TITLES + LANGUAGE_KEYWORDS + LOCATION_KEYWORDS).union(
+    *(keywords for _, keywords in SENIORITY_KEYWORDS + CONTRACT_KEYWORDS)
+)
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over the description keywords (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in _DESCRIPTION_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
+def _find_description_keywords(desc_lower: str) -> frozenset:
+    """Return the description keywords contained in a lowercased description."""
+    if _KEYWORD_AUTOMATON is not None:
+        # One pass over the text instead of one substring search per keyword
+        return frozenset(keyword for _, keyword in _KEYWORD_AUTOMATON.iter(desc_lower))
+    return frozenset(keyword for keyword in _DESCRIPTION_KEYWORDS if keyword in desc_lower)
+
+
+# Number of analysed job descriptions kept in memory per AgentRH
+OFFER_CACHE_SIZE = 256
+
 
 class AgentRH:
     """
@@ -22,6 +255,10 @@ class AgentRH:
             llm: Optional LLM for advanced parsing (can use RAG system)
         """
         self.llm = llm
+        
+        # Criteria-independent description analyses by hash, see analyse_description
+        self._offer_cache = LRUCache(maxsize=OFFER_CACHE_SIZE)
+        self._offer_cache_lock = threading.Lock()
     
     def analyser_offre(self, 
                       description_poste: str,
@@ -37,210 +274,170 @@ class AgentRH:
             Structured profile dictionary with requirements
         """
         criteres = criteres or {}
-        desc_lower = description_poste.lower()
         
-        # Extract job title
-        poste = self._extract_poste(description_poste, desc_lower)
-        
-        # Extract seniority level
-        seniorite = self._extract_seniorite(desc_lower)
+        # Text analysis (cached per description)
+        analysis = self.analyse_description(description_poste)
+        keywords_found = analysis["keywords_found"]
         
         # Extract experience requirements
-        exp_min, exp_max = self._extract_experience(desc_lower, criteres)
-        
-        # Extract required and optional skills
-        skills_obligatoires, skills_optionnelles = self._extract_skills(desc_lower, description_poste)
+        exp_min, exp_max = self._extract_experience(analysis["exp_years"], criteres)
         
         # Extract languages
-        langues = self._extract_languages(desc_lower, criteres)
+        langues = self._extract_languages(keywords_found, criteres)
         
         # Extract location
-        lieu = self._extract_location(desc_lower, criteres)
+        lieu = self._extract_location(keywords_found, criteres)
         
         # Extract salary range
-        salaire_min, salaire_max = self._extract_salary(desc_lower, criteres)
+        salaire_min, salaire_max = self._extract_salary(analysis["salaries"], criteres)
         
         # Extract contract type
-        contrat = self._extract_contract_type(desc_lower, criteres)
-        
-        # Extract keywords
-        mots_cles = self._extract_keywords(description_poste)
+        contrat = self._extract_contract_type(keywords_found, criteres)
         
         return {
-            "poste": poste,
-            "seniorite": seniorite,
+            "poste": analysis["poste"],
+            "seniorite": analysis["seniorite"],
             "exp_min": exp_min,
             "exp_max": exp_max,
-            "skills_obligatoires": skills_obligatoires,
-            "skills_optionnelles": skills_optionnelles,
+            "skills_obligatoires": list(analysis["skills_obligatoires"]),
+            "skills_optionnelles": list(analysis["skills_optionnelles"]),
             "langues": langues,
             "lieu": lieu,
             "salaire_min": salaire_min,
             "salaire_max": salaire_max,
             "contrat": contrat,
-            "mots_cles": mots_cles,
+            "mots_cles": list(analysis["mots_cles"]),
             "notes_libres": criteres.get("notes", "")
         }
     
-    def _extract_poste(self, description: str, desc_lower: str) -> str:
+    @staticmethod
+    def _hash_description(description: str) -> str:
+        """Content hash of a job description (analysis cache key)."""
+        return hashlib.blake2b(description.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def analyse_description(self, description_poste: str) -> Dict[str, Any]:
+        """
+        Analyze the text of a job description, independently of recruiter criteria.
+        
+        Results are memoized by description content, so evaluating many
+        candidates against the same offer only parses it once.
+        
+        Args:
+            description_poste: Job description text
+            
+        Returns:
+            Read-only analysis (poste, seniorite, exp_years, salaries,
+            skills_obligatoires, skills_optionnelles, keywords_found, mots_cles),
+            with tuples and frozensets only: do not modify it
+        """
+        key = self._hash_description(description_poste)
+        with self._offer_cache_lock:
+            analysis = self._offer_cache.get(key)
+        if analysis is None:
+            analysis = self._analyse_description(description_poste)
+            with self._offer_cache_lock:
+                self._offer_cache[key] = analysis
+        return analysis
+    
+    def _analyse_description(self, description_poste: str) -> Dict[str, Any]:
+        """Run every text extractor on a job description (uncached, see analyse_description)."""
+        desc_lower = description_poste.lower()
+        keywords_found = _find_description_keywords(desc_lower)
+        
+        # Required and optional skills
+        skills_obligatoires, skills_optionnelles = self._extract_skills(desc_lower, description_poste)
+        
+        return {
+            "poste": self._extract_poste(description_poste, keywords_found),
+            "seniorite": self._extract_seniorite(keywords_found),
+            "exp_years": self._find_experience_years(desc_lower),
+            "salaries": self._find_salaries(desc_lower),
+            "skills_obligatoires": tuple(skills_obligatoires),
+            "skills_optionnelles": tuple(skills_optionnelles),
+            "keywords_found": keywords_found,
+            "mots_cles": tuple(self._extract_keywords(description_poste))
+        }
+    
+    def _extract_poste(self, description: str, keywords_found: frozenset) -> str:
         """Extract job title."""
-        # Common job titles
-        job_titles = [
-            "data scientist", "data engineer", "data analyst",
-            "machine learning engineer", "ml engineer",
-            "developpeur", "developer", "ingenieur", "engineer",
-            "product manager", "project manager",
-            "qa engineer", "test engineer", "quality assurance",
-            "devops engineer", "cloud engineer",
-            "full stack", "frontend", "backend",
-            "cybersecurity", "security engineer"
-        ]
-        
-        for title in job_titles:
-            if title in desc_lower:
-                return title.title()
+        # Common job titles, first of the list found wins
+        for title in JOB_TITLES:
+            if title in keywords_found:
+                return _JOB_TITLE_NAMES[title]
         
         # Try to extract from first line
-        first_line = description.split('\n')[0].strip()
+        first_line = description.partition('\n')[0].strip()
         if len(first_line) < 100:
             return first_line
         
         return "Poste non spécifié"
     
-    def _extract_seniorite(self, desc_lower: str) -> str:
+    def _extract_seniorite(self, keywords_found: frozenset) -> str:
         """Extract seniority level."""
-        if any(word in desc_lower for word in ["senior", "sénior", "expérimenté", "expert"]):
-            return "senior"
-        elif any(word in desc_lower for word in ["junior", "débutant", "entry level", "stagiaire"]):
-            return "junior"
-        elif any(word in desc_lower for word in ["mid", "intermédiaire"]):
-            return "mid"
+        for level, keywords in SENIORITY_KEYWORDS:
+            if not keywords_found.isdisjoint(keywords):
+                return level
         return "non spécifié"
     
-    def _extract_experience(self, desc_lower: str, criteres: Dict) -> tuple:
+    def _find_experience_years(self, desc_lower: str) -> tuple:
+        """Years of experience mentioned in the text (first match of each pattern)."""
+        exp_years = []
+        for pattern in _EXPERIENCE_RES:
+            match = pattern.search(desc_lower)
+            if match:
+                exp_years.append(int(match.group(1)))
+        return tuple(exp_years)
+    
+    def _extract_experience(self, exp_years: tuple, criteres: Dict) -> tuple:
         """Extract experience requirements."""
         exp_min = criteres.get("exp_min", 0)
         exp_max = criteres.get("exp_max", 0)
         
-        # Extract from text
-        exp_patterns = [
-            r"(\d+)\s*ans?\s*d['\s]expérience",
-            r"(\d+)\s*ans?\s*d['\s]exp",
-            r"minimum\s*(\d+)\s*ans?",
-            r"au moins\s*(\d+)\s*ans?",
-            r"(\d+)\+?\s*ans?\s*d['\s]expérience"
-        ]
-        
-        for pattern in exp_patterns:
-            matches = re.findall(pattern, desc_lower)
-            if matches:
-                exp_min = max(exp_min, int(matches[0]))
+        for years in exp_years:
+            exp_min = max(exp_min, years)
         
         return exp_min, exp_max
     
     def _extract_skills(self, desc_lower: str, description: str) -> tuple:
         """Extract required and optional skills with better section detection."""
-        # Find sections for required vs optional skills
-        required_section_start = -1
-        optional_section_start = -1
-        
-        # Look for section headers
-        required_markers = [
-            "compétences techniques requises", "compétences requises", 
-            "requis", "obligatoire", "must have", "nécessaire"
-        ]
-        optional_markers = [
-            "compétences appréciées", "compétences optionnelles",
-            "optionnel", "nice to have", "souhaitable", "bonus", "apprécié"
-        ]
-        
-        # Find where required section starts
-        for marker in required_markers:
-            idx = desc_lower.find(marker)
-            if idx != -1:
-                required_section_start = idx
-                break
-        
-        # Find where optional section starts
-        for marker in optional_markers:
-            idx = desc_lower.find(marker)
-            if idx != -1:
-                optional_section_start = idx
-                break
+        # Find sections for required vs optional skills (first header found)
+        required_section_start = _find_first_marker(desc_lower, REQUIRED_SECTION_MARKERS)
+        optional_section_start = _find_first_marker(desc_lower, OPTIONAL_SECTION_MARKERS)
+        
+        # Section boundaries, the same for every skill match
+        required_section_end = optional_section_start if optional_section_start != -1 else len(desc_lower)
+        optional_section_end = len(desc_lower)
+        
+        # Find end markers for sections
+        if required_section_start != -1:
+            # Look for end of required section
+            for end_marker in REQUIRED_SECTION_END_MARKERS:
+                end_idx = desc_lower.find(end_marker, required_section_start)
+                if end_idx != -1 and end_idx < required_section_end:
+                    required_section_end = end_idx
+        
+        if optional_section_start != -1:
+            # Look for end of optional section
+            for end_marker in OPTIONAL_SECTION_END_MARKERS:
+                end_idx = desc_lower.find(end_marker, optional_section_start)
+                if end_idx != -1 and end_idx < optional_section_end:
+                    optional_section_end = end_idx
         
         # If we found sections, extract skills from appropriate sections
-        skills_obligatoires = []
-        skills_optionnelles = []
-        
-        # Common technical skills with variations
-        all_skills = [
-            "python", "java", "javascript", "typescript", "c++", "c#", "go", "rust",
-            "sql", "nosql", "mongodb", "postgresql", "mysql",
-            "machine learning", "ml", "deep learning", "tensorflow", "pytorch", "scikit-learn", "scikit learn", "sklearn",
-            "pandas", "numpy", "spark", "apache spark", "pyspark", "hadoop",
-            "aws", "azure", "gcp", "google cloud", "cloud", "docker", "kubernetes", "k8s",
-            "react", "vue", "angular", "node.js", "nodejs", "django", "flask",
-            "power bi", "powerbi", "tableau", "qlik", "looker",
-            "git", "github", "ci/cd", "cicd", "jenkins", "terraform", "ansible",
-            "mlops", "mlflow", "kubeflow", "airflow", "apache airflow",
-            "r"
-        ]
-        
-        # Normalize skill names for matching
-        skill_normalizations = {
-            "scikit-learn": ["scikit-learn", "scikit learn", "sklearn"],
-            "apache spark": ["apache spark", "spark", "pyspark"],
-            "power bi": ["power bi", "powerbi"],
-            "node.js": ["node.js", "nodejs"],
-            "machine learning": ["machine learning", "ml"],
-            "ci/cd": ["ci/cd", "cicd"],
-            "apache airflow": ["apache airflow", "airflow"]
-        }
+        # (lowercased name -> name, in insertion order)
+        skills_obligatoires = {}
+        skills_optionnelles = {}
         
-        for skill in all_skills:
-            # Check all variations of the skill
-            skill_variations = [skill]
-            for normalized, variants in skill_normalizations.items():
-                if skill in variants:
-                    skill_variations.extend(variants)
-                    break
-            
+        # Positions of every skill variation in the description (single scan)
+        occurrences = _find_skill_variations(desc_lower)
+        
+        for skill, skill_variations in _SKILL_KEYWORD_VARIATIONS:
             found_in_required = False
             found_in_optional = False
             
             for variation in skill_variations:
-                if variation not in desc_lower:
-                    continue
-                
-                # Find all occurrences
-                import re
-                matches = list(re.finditer(re.escape(variation), desc_lower))
-                
-                for match in matches:
-                    match_pos = match.start()
-                    
-                    # Determine which section this match is in
-                    # Calculate section boundaries
-                    required_section_end = optional_section_start if optional_section_start != -1 else len(desc_lower)
-                    optional_section_end = len(desc_lower)
-                    
-                    # Find end markers for sections
-                    if required_section_start != -1:
-                        # Look for end of required section
-                        end_markers = ["compétences appréciées", "soft skills", "langues", "avantages"]
-                        for end_marker in end_markers:
-                            end_idx = desc_lower.find(end_marker, required_section_start)
-                            if end_idx != -1 and end_idx < required_section_end:
-                                required_section_end = end_idx
-                    
-                    if optional_section_start != -1:
-                        # Look for end of optional section
-                        end_markers = ["soft skills", "langues", "avantages"]
-                        for end_marker in end_markers:
-                            end_idx = desc_lower.find(end_marker, optional_section_start)
-                            if end_idx != -1 and end_idx < optional_section_end:
-                                optional_section_end = end_idx
-                    
+                # All occurrences, in order
+                for match_pos in occurrences.get(variation, ()):
                     # Determine which section this match is in
                     if required_section_start != -1 and optional_section_start != -1:
                         # Both sections found - check boundaries
@@ -258,7 +455,7 @@ class AgentRH:
                             found_in_optional = True
                     else:
                         # No clear sections, use context-based detection
-                        context = self._get_skill_context(description, variation, window=100)
+                        context = self._get_skill_context(description, variation, window=100, text_lower=desc_lower)
                         context_lower = context.lower()
                         if any(kw in context_lower for kw in ["requis", "obligatoire", "must have", "nécessaire", "essentiel", "maîtrise", "expérience avec"]):
                             found_in_required = True
@@ -273,8 +470,7 @@ class AgentRH:
                                 found_in_optional = True
                             else:
                                 # Default to required for core skills, optional for others
-                                core_skills = ["python", "sql", "scikit-learn", "tensorflow", "pytorch", "spark", "hadoop", "postgresql", "mongodb", "git"]
-                                if any(cs in variation for cs in core_skills):
+                                if variation in _CORE_SKILL_VARIATIONS:
                                     found_in_required = True
                                 else:
                                     found_in_optional = True
@@ -285,120 +481,93 @@ class AgentRH:
                 if found_in_required or found_in_optional:
                     break
             
-            # Add to appropriate list
-            skill_name = skill.title()
-            # Handle special cases and normalize to avoid duplicates
-            if skill == "scikit-learn" or skill == "scikit learn" or skill == "sklearn":
-                skill_name = "Scikit-learn"
-            elif skill == "power bi" or skill == "powerbi":
-                skill_name = "Power BI"
-            elif skill == "node.js" or skill == "nodejs":
-                skill_name = "Node.js"
-            elif skill == "apache spark" or skill == "pyspark" or skill == "spark":
-                skill_name = "Apache Spark"  # Normalize all spark variants
-            elif skill == "apache airflow" or skill == "airflow":
-                skill_name = "Apache Airflow"
-            elif skill == "ci/cd" or skill == "cicd":
-                skill_name = "CI/CD"
-            elif skill == "ml" or skill == "machine learning":
-                skill_name = "Machine Learning"
-            elif skill == "aws" or skill == "azure" or skill == "gcp" or skill == "google cloud":
-                skill_name = "Cloud"  # Group cloud providers
-            elif skill == "mlops" or skill == "mlflow" or skill == "kubeflow":
-                skill_name = "MLOps"  # Group MLOps tools
+            # Add to appropriate list (special cases normalized to avoid duplicates)
+            skill_name = SKILL_DISPLAY_NAMES.get(skill) or skill.title()
             
-            # Check for duplicates before adding
+            # Add without duplicates
             if found_in_required:
-                # Remove any duplicates or more specific versions
-                skills_obligatoires = [s for s in skills_obligatoires if s.lower() != skill_name.lower() and skill_name.lower() not in s.lower()]
-                if skill_name not in skills_obligatoires:
-                    skills_obligatoires.append(skill_name)
+                _add_skill(skills_obligatoires, skill_name)
             elif found_in_optional:
-                # Remove any duplicates or more specific versions
-                skills_optionnelles = [s for s in skills_optionnelles if s.lower() != skill_name.lower() and skill_name.lower() not in s.lower()]
-                if skill_name not in skills_optionnelles:
-                    skills_optionnelles.append(skill_name)
-        
-        # Final cleanup: remove duplicates and normalize
-        skills_obligatoires = list(dict.fromkeys(skills_obligatoires))  # Preserve order, remove duplicates
-        skills_optionnelles = list(dict.fromkeys(skills_optionnelles))
+                _add_skill(skills_optionnelles, skill_name)
         
         # Remove skills from optional if they're already in required
-        skills_optionnelles = [s for s in skills_optionnelles if s not in skills_obligatoires]
+        required = list(skills_obligatoires.values())
+        optional = [s for s in skills_optionnelles.values() if skills_obligatoires.get(s.lower()) != s]
         
-        return skills_obligatoires, skills_optionnelles
+        return required, optional
     
-    def _get_skill_context(self, text: str, skill: str, window: int = 50) -> str:
-        """Get context around skill mention."""
-        idx = text.lower().find(skill.lower())
+    def _get_skill_context(self, text: str, skill: str, window: int = 50,
+                           text_lower: Optional[str] = None) -> str:
+        """Get context around skill mention (text_lower: text.lower(), if already computed)."""
+        if text_lower is None:
+            text_lower = text.lower()
+        idx = text_lower.find(skill.lower())
         if idx == -1:
             return ""
         start = max(0, idx - window)
         end = min(len(text), idx + len(skill) + window)
         return text[start:end]
     
-    def _extract_languages(self, desc_lower: str, criteres: Dict) -> List[str]:
+    def _extract_languages(self, keywords_found: frozenset, criteres: Dict) -> List[str]:
         """Extract language requirements."""
         langues = criteres.get("langues", [])
         
-        languages = ["français", "anglais", "espagnol", "allemand", "italien", "chinois"]
-        for lang in languages:
-            if lang in desc_lower:
+        for lang in LANGUAGE_KEYWORDS:
+            if lang in keywords_found:
                 if lang not in langues:
                     langues.append(lang.title())
         
         return langues if langues else ["Français"]
     
-    def _extract_location(self, desc_lower: str, criteres: Dict) -> str:
+    def _extract_location(self, keywords_found: frozenset, criteres: Dict) -> str:
         """Extract location."""
         if criteres.get("lieu"):
             return criteres["lieu"]
         
-        locations = ["paris", "lyon", "marseille", "toulouse", "remote", "télétravail"]
-        for loc in locations:
-            if loc in desc_lower:
+        for loc in LOCATION_KEYWORDS:
+            if loc in keywords_found:
                 return loc.title()
         
         return "Non spécifié"
     
-    def _extract_salary(self, desc_lower: str, criteres: Dict) -> tuple:
+    def _find_salaries(self, desc_lower: str) -> tuple:
+        """
+        Salaries mentioned in the text (first match of each pattern, spaces removed).
+        
+        Returns:
+            (min, max) pairs, max being None for patterns with a single amount
+        """
+        salaries = []
+        desc_compact = desc_lower.replace(" ", "")
+        for pattern in _SALARY_RES:
+            match = pattern.search(desc_compact)
+            if match:
+                if pattern.groups > 1:
+                    salaries.append((int(match.group(1)), int(match.group(2))))
+                else:
+                    salaries.append((int(match.group(1)), None))
+        return tuple(salaries)
+    
+    def _extract_salary(self, salaries: tuple, criteres: Dict) -> tuple:
         """Extract salary range."""
         salaire_min = criteres.get("salaire_min", 0)
         salaire_max = criteres.get("salaire_max", 0)
         
-        # Try to extract from text
-        salary_patterns = [
-            r"(\d+)\s*€?\s*-\s*(\d+)\s*€",
-            r"(\d+)\s*k?\s*€?\s*/\s*an",
-            r"salaire\s*:\s*(\d+)\s*€"
-        ]
-        
-        for pattern in salary_patterns:
-            matches = re.findall(pattern, desc_lower.replace(" ", ""))
-            if matches:
-                if isinstance(matches[0], tuple):
-                    salaire_min = int(matches[0][0])
-                    salaire_max = int(matches[0][1]) if len(matches[0]) > 1 else salaire_min
-                else:
-                    salaire_min = int(matches[0])
+        # Later patterns override earlier ones
+        for amount_min, amount_max in salaries:
+            salaire_min = amount_min
+            if amount_max is not None:
+                salaire_max = amount_max
         
         return salaire_min, salaire_max
     
-    def _extract_contract_type(self, desc_lower: str, criteres: Dict) -> str:
+    def _extract_contract_type(self, keywords_found: frozenset, criteres: Dict) -> str:
         """Extract contract type."""
         if criteres.get("contrat"):
             return criteres["contrat"]
         
-        contract_types = {
-            "cdi": ["cdi", "permanent"],
-            "cdd": ["cdd", "temporary", "temporaire"],
-            "stage": ["stage", "internship", "stagiaire"],
-            "alternance": ["alternance", "apprentissage", "apprenticeship"],
-            "freelance": ["freelance", "consultant", "indépendant"]
-        }
-        
-        for contract, keywords in contract_types.items():
-            if any(kw in desc_lower for kw in keywords):
+        for contract, keywords in CONTRACT_KEYWORDS:
+            if not keywords_found.isdisjoint(keywords):
                 return contract.upper()
         
         return "CDI"
@@ -406,11 +575,10 @@ class AgentRH:
     def _extract_keywords(self, description: str) -> List[str]:
         """Extract important keywords from description."""
         # Simple keyword extraction (can be enhanced)
-        words = re.findall(r'\b[a-z]{4,}\b', description.lower())
+        counts = Counter(_KEYWORD_RE.findall(description.lower()))
         # Filter common words
-        stop_words = {"dans", "pour", "avec", "sont", "cette", "dans", "plus", "tous", "toutes"}
-        keywords = [w for w in words if w not in stop_words]
+        for word in _STOP_WORDS:
+            counts.pop(word, None)
         # Return most frequent
-        from collections import Counter
-        return [word for word, count in Counter(keywords).most_common(10)]
+        return [word for word, count in counts.most_common(10)]
 
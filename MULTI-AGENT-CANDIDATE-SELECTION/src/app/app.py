@@ -18,7 +18,7 @@ try:
     from src.main import MultiAgentPipeline
     from src.rag_new.rag_system import create_rag_system_from_config
     from src.config import RAW_DIR, DATA_DIR
-    import pdfplumber
+    from src.utils import extract_pdf_text
 except ImportError as e:
     st.error(f"❌ Import error: {e}")
     st.stop()
@@ -157,13 +157,7 @@ def extract_text_from_file(file_path: Path) -> str:
     """Extract text from file (PDF or TXT)."""
     try:
         if file_path.suffix.lower() == ".pdf":
-            text_parts = []
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-            return "\n\n".join(text_parts)
+            return extract_pdf_text(file_path)
         else:
             return file_path.read_text(encoding='utf-8', errors='ignore')
     except Exception as e:
@@ -10,6 +10,9 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = REPO_ROOT / "DATA"
 RAW_DIR = DATA_DIR / "raw"
 
+# Cache for parsed documents and embeddings
+CACHE_DIR = DATA_DIR / "cache"
+
 # Vector store directory
 VECTORSTORE_DIR = REPO_ROOT / "vectorstore"
 
@@ -5,8 +5,7 @@ Orchestrates all agents and integrates with LlamaIndex RAG system
 
 import sys
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import pdfplumber
+from typing import Callable, List, Dict, Any, Optional
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -17,6 +16,7 @@ from src.agents import (
     AgentSoftSkills, AgentDecideur
 )
 from src.rag_new.rag_system import RAGSystem, create_rag_system_from_config
+from src.utils import cached_pdf_text
 
 
 class MultiAgentPipeline:
@@ -56,7 +56,8 @@ class MultiAgentPipeline:
                          criteres: Optional[Dict] = None,
                          use_rag: bool = True,
                          max_candidates: int = 10,
-                         cv_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+                         cv_ids: Optional[List[str]] = None,
+                         progress_cb: Optional[Callable[[str, int], None]] = None) -> Dict[str, Any]:
         """
         Process a job offer and evaluate candidates.
         
@@ -65,13 +66,19 @@ class MultiAgentPipeline:
             criteres: Additional criteria from recruiter
             use_rag: Whether to use RAG for candidate retrieval
             max_candidates: Maximum number of candidates to evaluate
+            cv_ids: Optional list of specific CV IDs to evaluate
+            progress_cb: Optional callback(agent_id, percent) called as each agent progresses
             
         Returns:
             Dictionary with job profile, evaluated candidates, and final report
         """
+        report_progress = progress_cb or (lambda agent_id, progress: None)
+        
         # Step 1: Agent RH - Analyze job offer
         print("📋 Agent RH: Analyzing job offer...")
+        report_progress("rh-agent", 0)
         job_profile = self.agent_rh.analyser_offre(job_description, criteres)
+        report_progress("rh-agent", 100)
         print(f"✅ Job profile extracted: {job_profile.get('poste', 'N/A')}")
         
         # Step 2: Retrieve candidates using cv_ids, RAG, or direct file access
@@ -104,16 +111,24 @@ class MultiAgentPipeline:
                 candidate_data, job_profile
             )
             evaluations.append(evaluation)
+            
+            # Profile, technical and soft skills agents all run once per candidate
+            candidate_progress = int(i / len(candidates_data) * 100)
+            for agent_id in ("profile-agent", "technical-agent", "softskills-agent"):
+                report_progress(agent_id, candidate_progress)
         
         # Step 4: Agent Décideur - Rank candidates
         print(f"\n⚖️  Agent Décideur: Ranking candidates...")
+        report_progress("decision-agent", 0)
         ranked_candidates = self.agent_decideur.classer_candidats(evaluations)
+        report_progress("decision-agent", 50)
         
         # Step 5: Generate final report
         print(f"\n📊 Generating final report...")
         report = self.agent_decideur.generer_rapport_final(
             ranked_candidates, job_profile
         )
+        report_progress("decision-agent", 100)
         
         return {
             "job_profile": job_profile,
@@ -348,13 +363,7 @@ class MultiAgentPipeline:
     def _extract_pdf_text(self, pdf_path: Path) -> str:
         """Extract text from PDF file."""
         try:
-            text_parts = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-            return "\n\n".join(text_parts)
+            return cached_pdf_text(pdf_path)
         except Exception as e:
             print(f"⚠️  PDF extraction failed: {e}")
             return ""
@@ -375,10 +384,12 @@ class MultiAgentPipeline:
         cv_text = candidate_data.get("content", "")
         source = candidate_data.get("source", "unknown")
         
+        lettre_motivation = ""  # Can be enhanced to load cover letters
+        
         # Agent Profil - Extract candidate profile
         profil_data = self.agent_profil.analyser_candidat(
             cv_text=cv_text,
-            lettre_motivation="",  # Can be enhanced to load cover letters
+            lettre_motivation=lettre_motivation,
             job_profile=job_profile
         )
         
@@ -390,7 +401,7 @@ class MultiAgentPipeline:
         
         # Agent Soft Skills - Evaluate soft skills
         softskills_data = self.agent_softskills.evaluer_soft_skills(
-            lettre_motivation=profil_data.get("lettre_motivation", ""),
+            lettre_motivation=lettre_motivation,
             cv_text=cv_text,
             experience=profil_data.get("experience", []),
             job_profile=job_profile
@@ -1,6 +1,6 @@
 """LlamaIndex-based RAG System"""
 
-from .rag_system import RAGSystem, create_rag_system_from_config
+from .rag_system import RAGSystem, create_rag_system_from_config, load_documents_cached, parse_document
 
-__all__ = ['RAGSystem', 'create_rag_system_from_config']
+__all__ = ['RAGSystem', 'create_rag_system_from_config', 'load_documents_cached', 'parse_document']
 
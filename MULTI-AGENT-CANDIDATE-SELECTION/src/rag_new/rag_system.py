@@ -4,6 +4,7 @@ Modern, efficient RAG implementation using LlamaIndex
 """
 
 import os
+import hashlib
 import yaml
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -20,6 +21,10 @@ import sys
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 from llm_fallback import create_llm_with_fallback
+from src.utils import cached_pdf_pages, load_file_text, read_cache, write_cache
+
+# File types indexed from the data directory
+DOCUMENT_SUFFIXES = (".txt", ".pdf")
 
 
 class RAGSystem:
@@ -28,12 +33,22 @@ class RAGSystem:
     Handles document loading, indexing, and querying.
     """
     
+    # HNSW settings for the Chroma collection, only applied when it is created: an index
+    # built before with the default l2 distance keeps it until it is rebuilt
+    COLLECTION_METADATA = {
+        "hnsw:space": "cosine",
+        "hnsw:construction_ef": 200,
+        "hnsw:M": 32,
+        "hnsw:search_ef": 128
+    }
+    
     def __init__(self, 
                  data_dir: str = "./DATA/raw",
                  vectorstore_dir: str = "./vectorstore",
                  embedding_model: str = "BAAI/bge-large-en-v1.5",
                  chunk_size: int = 1024,
                  chunk_overlap: int = 128,
+                 quantize_embeddings: bool = False,
                  groq_api_key: Optional[str] = None,
                  groq_model: str = "llama-3.3-70b-versatile",
                  gemini_api_key: Optional[str] = None,
@@ -47,6 +62,7 @@ class RAGSystem:
             embedding_model: HuggingFace embedding model name
             chunk_size: Size of text chunks
             chunk_overlap: Overlap between chunks
+            quantize_embeddings: Quantize the embedding model to INT8 (CPU only)
             groq_api_key: Groq API key for LLM (optional if load_from_config)
             groq_model: Groq model name
             gemini_api_key: Gemini API key for fallback (optional if load_from_config)
@@ -61,7 +77,8 @@ class RAGSystem:
         # Initialize embedding model
         print(f"🔧 Loading embedding model: {embedding_model}")
         self.embed_model = HuggingFaceEmbedding(model_name=embedding_model)
-        print(f"✅ Embedding model loaded")
+        self.quantize_embeddings = quantize_embeddings and self._quantize_embed_model()
+        print(f"✅ Embedding model loaded{' (INT8)' if self.quantize_embeddings else ''}")
         
         # Initialize ChromaDB
         self.vectorstore_dir.mkdir(parents=True, exist_ok=True)
@@ -84,6 +101,29 @@ class RAGSystem:
         # Initialize index (will be built or loaded)
         self.index = None
         self.query_engine = None
+    
+    def _quantize_embed_model(self) -> bool:
+        """
+        Apply dynamic INT8 quantization to the Linear layers of the embedding model.
+        
+        Only done on CPU, where it roughly halves memory traffic and speeds up
+        batch embedding. Returns True if the model was quantized.
+        """
+        try:
+            import torch
+            
+            model = self.embed_model._model
+            if next(model.parameters()).device.type != "cpu":
+                print("⚠️  Embedding quantization skipped: model is not on CPU")
+                return False
+            
+            self.embed_model._model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            return True
+        except Exception as e:
+            print(f"⚠️  Embedding quantization failed, keeping FP32 model: {e}")
+            return False
         
     def build_index(self):
         """
@@ -139,7 +179,8 @@ class RAGSystem:
         
         # Create fresh collection
         chroma_collection = self.chroma_client.create_collection(
-            name=self.collection_name
+            name=self.collection_name,
+            metadata=self.COLLECTION_METADATA
         )
         vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
         storage_context = StorageContext.from_defaults(vector_store=vector_store)
@@ -212,10 +253,9 @@ class RAGSystem:
         try:
             print(f"📂 Loading existing index from {self.vectorstore_dir}...")
             
-            # Get ChromaDB collection
-            chroma_collection = self.chroma_client.get_or_create_collection(
-                name=self.collection_name
-            )
+            # Get ChromaDB collection as built (its HNSW settings, e.g. the distance,
+            # are fixed at creation: COLLECTION_METADATA only applies to rebuilt indexes)
+            chroma_collection = self.chroma_client.get_collection(name=self.collection_name)
             vector_store = ChromaVectorStore(chroma_collection=chroma_collection)
             storage_context = StorageContext.from_defaults(vector_store=vector_store)
             
@@ -413,6 +453,64 @@ class RAGSystem:
         return results
 
 
+def parse_document(file_path: Path) -> List[Document]:
+    """
+    Parse one CV file into Documents (PyMuPDF for PDFs).
+    
+    PDFs give one Document per page with text, carrying its page_label
+    (1-based, as SimpleDirectoryReader did) for search/query sources;
+    text files give a single Document.
+    """
+    metadata = {"file_path": str(file_path), "file_name": file_path.name}
+    if file_path.suffix.lower() != ".pdf":
+        return [Document(text=load_file_text(file_path), id_=str(file_path), metadata=metadata)]
+    
+    return [
+        Document(
+            text=page_text,
+            id_=f"{file_path}_part_{page_number}",
+            metadata={**metadata, "page_label": str(page_number + 1)}
+        )
+        for page_number, page_text in enumerate(cached_pdf_pages(file_path))
+        if page_text
+    ]
+
+
+def load_documents_cached(data_dir: Path) -> List[Document]:
+    """
+    Load all documents of a directory, only parsing new or modified files.
+    
+    Parsed documents are cached on disk keyed by path, size and mtime.
+    
+    Args:
+        data_dir: Directory containing the CV files
+        
+    Returns:
+        List of documents, one per PDF page / text file (see parse_document)
+    """
+    data_dir = Path(data_dir)
+    cache_key = hashlib.md5(str(data_dir.resolve()).encode()).hexdigest()
+    cached_docs = read_cache("page_documents", cache_key) or {}
+    
+    documents = []
+    current_docs = {}
+    for file_path in sorted(data_dir.iterdir()):
+        if not file_path.is_file() or file_path.suffix.lower() not in DOCUMENT_SUFFIXES:
+            continue
+        stat = file_path.stat()
+        file_key = f"{file_path.name}:{stat.st_size}:{stat.st_mtime_ns}"
+        file_documents = cached_docs.get(file_key)
+        if file_documents is None:
+            file_documents = parse_document(file_path)
+        current_docs[file_key] = file_documents
+        documents.extend(file_documents)
+    
+    if current_docs.keys() != cached_docs.keys():
+        write_cache("page_documents", cache_key, current_docs)
+    
+    return documents
+
+
 def create_rag_system_from_config(config_path: str = "Config.yaml") -> RAGSystem:
     """
     Create RAG system from configuration file.
@@ -450,6 +548,7 @@ def create_rag_system_from_config(config_path: str = "Config.yaml") -> RAGSystem
         embedding_model=embedding.get('model_name', 'BAAI/bge-large-en-v1.5'),
         chunk_size=doc_processing.get('chunk_size', 1024),
         chunk_overlap=doc_processing.get('chunk_overlap', 128),
+        quantize_embeddings=embedding.get('quantize', False),
         groq_api_key=groq_config.get('api_key'),
         groq_model=groq_config.get('model', 'llama-3.3-70b-versatile'),
         gemini_api_key=gemini_config.get('api_key'),
@@ -1 +1,19 @@
 """Fonctions utilitaires pour le projet."""
+
+from .pdf_extraction import extract_pdf_pages, extract_pdf_text
+from .file_cache import file_cache_key, cached_pdf_pages, cached_pdf_text, load_file_text, read_cache, write_cache
+from .state_store import StateStore, RedisStateStore, create_state_store
+
+__all__ = [
+    'extract_pdf_pages',
+    'extract_pdf_text',
+    'file_cache_key',
+    'cached_pdf_pages',
+    'cached_pdf_text',
+    'load_file_text',
+    'read_cache',
+    'write_cache',
+    'StateStore',
+    'RedisStateStore',
+    'create_state_store'
+]
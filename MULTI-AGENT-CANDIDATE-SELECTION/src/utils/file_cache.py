@@ -0,0 +1,93 @@
+"""
+On-disk cache for derived file data (parsed PDF text, embeddings)
+Entries are keyed by a cheap file hash so unchanged files are never reprocessed
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+from src.config import CACHE_DIR
+from .pdf_extraction import extract_pdf_pages, join_pdf_pages
+
+# Bytes of file content hashed into the cache key
+HASH_HEAD_BYTES = 65536
+
+
+def file_cache_key(file_path: Union[str, Path], extra: str = "") -> str:
+    """
+    Compute a cache key from the head of the file, its size and mtime.
+    
+    Args:
+        file_path: File to fingerprint
+        extra: Additional discriminator (e.g. model name, chunking settings)
+        
+    Returns:
+        Hex digest identifying this version of the file
+    """
+    file_path = Path(file_path)
+    stat = file_path.stat()
+    with open(file_path, "rb") as f:
+        digest = hashlib.md5(f.read(HASH_HEAD_BYTES))
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}:{extra}".encode())
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a cache entry, ignoring failures (the cache is best effort)."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One temp file per writer thread so concurrent writes of the same entry never mix
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  Could not write cache entry {path.name}: {e}")
+
+
+def cached_pdf_pages(pdf_path: Union[str, Path]) -> List[str]:
+    """Extract the text of each PDF page, reusing the cached result if the file is unchanged."""
+    key = file_cache_key(pdf_path)
+    pages = read_cache("pdf_pages", key)
+    if pages is None:
+        pages = extract_pdf_pages(pdf_path)
+        write_cache("pdf_pages", key, pages)
+    return pages
+
+
+def cached_pdf_text(pdf_path: Union[str, Path]) -> str:
+    """Extract PDF text (pages joined by blank lines) through the page cache."""
+    return join_pdf_pages(cached_pdf_pages(pdf_path))
+
+
+def load_file_text(file_path: Union[str, Path]) -> str:
+    """
+    Read a CV or job offer as plain text (PDF through the text cache).
+    
+    Blocking I/O: async callers run it in a worker thread (asyncio.to_thread);
+    the cache is safe to share between threads.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() == ".pdf":
+        return cached_pdf_text(file_path)
+    return file_path.read_text(encoding="utf-8", errors="ignore")
+
+
+def read_cache(namespace: str, key: str) -> Optional[Any]:
+    """Load a pickled cache entry, or None if missing or unreadable."""
+    cache_path = CACHE_DIR / namespace / f"{key}.pkl"
+    if not cache_path.exists():
+        return None
+    try:
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def write_cache(namespace: str, key: str, value: Any) -> None:
+    """Pickle a value into the cache."""
+    _write_atomic(CACHE_DIR / namespace / f"{key}.pkl", pickle.dumps(value))
@@ -0,0 +1,49 @@
+"""
+PDF text extraction
+Uses PyMuPDF (fitz) for fast plain-text extraction, pdfplumber as fallback
+"""
+
+from pathlib import Path
+from typing import List, Union
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+
+def extract_pdf_pages(pdf_path: Union[str, Path]) -> List[str]:
+    """
+    Extract the plain text of each page of a PDF file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        One text per page, in page order ("" for pages without text)
+    """
+    if fitz is not None:
+        with fitz.open(str(pdf_path)) as doc:
+            return [page.get_text("text") or "" for page in doc]
+    
+    import pdfplumber
+    with pdfplumber.open(pdf_path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def join_pdf_pages(pages: List[str]) -> str:
+    """Join page texts by blank lines, skipping pages without text."""
+    return "\n\n".join(page_text for page_text in pages if page_text)
+
+
+def extract_pdf_text(pdf_path: Union[str, Path]) -> str:
+    """
+    Extract plain text from a PDF file.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        
+    Returns:
+        Text of all pages joined by blank lines
+    """
+    return join_pdf_pages(extract_pdf_pages(pdf_path))
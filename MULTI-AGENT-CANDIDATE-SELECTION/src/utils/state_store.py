@@ -0,0 +1,84 @@
+"""
+State storage for long-running API jobs (index builds, evaluations)
+Uses Redis when REDIS_URL is set, so several API workers share job state
+"""
+
+import os
+from typing import Any, Dict, Optional
+
+import orjson
+from cachetools import TTLCache
+
+# Job states expire one hour after their last update
+STATE_TTL_SECONDS = 3600
+
+# Max job states kept in process memory per namespace
+MAX_LOCAL_STATES = 512
+
+
+class StateStore:
+    """
+    In-process job state store, bounded in size and age.
+    Returned states are the stored objects, so in-place updates are visible immediately.
+    """
+    
+    def __init__(self, namespace: str, ttl: int = STATE_TTL_SECONDS):
+        """
+        Initialize the store.
+        
+        Args:
+            namespace: Key prefix for this kind of job (e.g. "build")
+            ttl: Seconds a state is kept after its last update
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self._states: Dict[str, Dict[str, Any]] = TTLCache(maxsize=MAX_LOCAL_STATES, ttl=ttl)
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a job state, or None if unknown."""
+        return self._states.get(key)
+    
+    async def set(self, key: str, state: Dict[str, Any]) -> None:
+        """Store (or refresh) a job state."""
+        self._states[key] = state
+
+
+class RedisStateStore(StateStore):
+    """Job state store backed by Redis, states are serialized with orjson."""
+    
+    def __init__(self, client, namespace: str, ttl: int = STATE_TTL_SECONDS):
+        # No local TTLCache: states only live in Redis
+        self.namespace = namespace
+        self.ttl = ttl
+        self.client = client
+    
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+    
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = await self.client.get(self._key(key))
+        return orjson.loads(data) if data is not None else None
+    
+    async def set(self, key: str, state: Dict[str, Any]) -> None:
+        await self.client.set(self._key(key), orjson.dumps(state), ex=self.ttl)
+
+
+def create_state_store(namespace: str, ttl: int = STATE_TTL_SECONDS) -> StateStore:
+    """
+    Create a job state store.
+    
+    Args:
+        namespace: Key prefix for this kind of job
+        ttl: Seconds a state is kept after its last update
+        
+    Returns:
+        Redis-backed store if REDIS_URL is set and redis is installed, in-process store otherwise
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            import redis.asyncio as redis
+            return RedisStateStore(redis.from_url(redis_url), namespace, ttl)
+        except ImportError:
+            print("⚠️  redis package not installed, keeping job state in process memory")
+    return StateStore(namespace, ttl)
@@ -1,5 +1,5 @@
 #!/bin/bash
 echo "Starting Multi-Agent Candidate Selection Backend API..."
 echo ""
-python backend_api.py
+exec python backend_api.py
 